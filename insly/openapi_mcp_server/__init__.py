@@ -27,48 +27,99 @@ OpenAPI MCP Server - A server that dynamically creates MCP tools and resources f
 
 __version__ = '0.1.0'
 
-import inspect
 import sys
+from types import FrameType
+from typing import Optional
 
 from loguru import logger
 
-# Remove default loguru handler
-logger.remove()
+# Enhanced logging format including function name, line number, and logger name.
+# Fixed the whitespace issue after log level by removing padding
+_LOG_FORMAT = '<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>'
 
 def get_format():
-    return '<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>'
+    return _LOG_FORMAT
 
-# Set up enhanced logging format to include function name, line number, and logger name
-# Fixed the whitespace issue after log level by removing padding
-logger.add(
-    sys.stdout,
-    format=get_format(),
-    level='INFO',
-)
+# Handler id of the stdout sink installed by configure_logging
+_HANDLER_ID: Optional[int] = None
 
-def get_caller_info():
-    """Get information about the caller of a function.
+def configure_logging(level: str = 'INFO') -> None:
+    """Install the server's stdout sink, replacing loguru's default handler.
+
+    This is called by the server entry point rather than at import time, so
+    applications and tests importing the package can install their own sinks.
+    Calling it again only replaces the sink installed by the previous call.
+
+    Args:
+        level: Minimum log level for the sink
+    """
+    global _HANDLER_ID
+
+    if _HANDLER_ID is None:
+        # Remove default loguru handler
+        logger.remove()
+    else:
+        try:
+            logger.remove(_HANDLER_ID)
+        except ValueError:
+            # The sink was already removed elsewhere
+            pass
+
+    _HANDLER_ID = logger.add(
+        sys.stdout,
+        format=_LOG_FORMAT,
+        level=level,
+        # Tracebacks attached with logger.opt(exception=True) must not print
+        # frame locals: they include auth headers and credentials
+        backtrace=False,
+        diagnose=False,
+    )
+
+def set_log_level(level: str) -> None:
+    """Change the level of the server's stdout sink without touching other sinks.
+
+    Args:
+        level: New minimum log level
+    """
+    configure_logging(level)
+
+# Numeric severity of loguru's DEBUG level
+_DEBUG_LEVEL_NO = 10
+
+def is_debug_enabled() -> bool:
+    """Check whether any installed sink accepts DEBUG messages.
+
+    Use this to skip building debug-only output that would otherwise be discarded.
 
     Returns:
-        str: A string containing information about the caller
+        bool: True if a DEBUG message would reach at least one sink
     """
-    # Get the current frame
-    current_frame = inspect.currentframe()
-    if not current_frame:
-        return 'unknown'
+    # loguru has no public accessor for the lowest level across its sinks
+    return logger._core.min_level <= _DEBUG_LEVEL_NO
 
-    # Go up one frame
-    parent_frame = current_frame.f_back
-    if not parent_frame:
-        return 'unknown'
+def get_caller_info(frame: Optional[FrameType] = None):
+    """Get information about the caller of a function.
+
+    Args:
+        frame: Frame to describe instead of looking one up. Pass the frame
+            captured at the call site when the description is built later,
+            e.g. lazily by the logger.
 
-    # Go up another frame to find the caller
-    caller_frame = parent_frame.f_back
-    if not caller_frame:
-        return 'unknown'
+    Returns:
+        str: A string containing information about the caller
+    """
+    if frame is None:
+        # Skip this function and its direct caller; sys._getframe avoids the
+        # source-file lookup that inspect.getframeinfo performs via linecache
+        try:
+            frame = sys._getframe(2)
+        except ValueError:
+            # Call stack is not deep enough
+            return 'unknown'
 
     # Get filename, function name, and line number
-    caller_info = inspect.getframeinfo(caller_frame)
-    return f'{caller_info.filename}:{caller_info.function}:{caller_info.lineno}'
+    code = frame.f_code
+    return f'{code.co_filename}:{code.co_name}:{frame.f_lineno}'
 
-__all__ = ['__version__', 'logger', 'get_caller_info']
+__all__ = ['__version__', 'logger', 'configure_logging', 'set_log_level', 'is_debug_enabled',
+           'get_caller_info']
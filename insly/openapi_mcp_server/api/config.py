@@ -23,14 +23,19 @@
 
 """Configuration module for the OpenAPI MCP Server."""
 
+import functools
 import os
+import sys
 from insly.openapi_mcp_server import get_caller_info, logger
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Tuple
 
-@dataclass
+@dataclass(slots=True, frozen=False)
 class Config:
-    """Configuration for the OpenAPI MCP Server."""
+    """Configuration for the OpenAPI MCP Server.
+
+    Uses ``__slots__``, so only the fields declared here can be set on an instance.
+    """
 
     # API information
     api_name: str = 'awslabs-openapi-mcp-server'
@@ -43,6 +48,7 @@ class Config:
     auth_username: str = ''
     auth_password: str = ''
     auth_token: str = ''
+    auth_token_ttl: int = 3600  # Bearer token cache TTL in seconds
     auth_api_key: str = ''
     auth_api_key_name: str = 'api_key'
     auth_api_key_in: str = 'header'  # header, query, cookie
@@ -58,6 +64,7 @@ class Config:
     port: int = 8000
     sse_port: int = 8001  # Port for SSE transport
     enable_sse: bool = True  # Enable SSE transport for legacy clients
+    enable_http: bool = True  # Enable streamable-http transport
     # Default to 0.0.0.0 for container compatibility; use SERVER_HOST env var to override
     host: str = '0.0.0.0'
     path: str = '/mcp'  # HTTP endpoint path
@@ -65,6 +72,91 @@ class Config:
     message_timeout: int = 60
     version: str = '0.1.0'
 
+    @property
+    def auth_cache_key(self) -> int:
+        """Get the key under which the auth provider for this config is cached.
+
+        Computed on each call, so plain attribute writes stay as cheap as on any
+        slotted dataclass.
+
+        Returns:
+            int: Hash of the auth-related configuration
+
+        """
+        return hash(
+            (
+                self.auth_type.lower(),
+                self.auth_token,
+                self.auth_username,
+                self.auth_password,
+                self.auth_api_key,
+                self.auth_api_key_name,
+                self.auth_api_key_in,
+            )
+        )
+
+# Environment variable name, Config attribute and value converter
+_ENV_SPEC: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    # API information
+    ('API_NAME', 'api_name', str),
+    ('API_BASE_URL', 'api_base_url', str),
+    ('API_SPEC_URL', 'api_spec_url', str),
+    ('API_SPEC_PATH', 'api_spec_path', str),
+    # Authentication
+    ('AUTH_TYPE', 'auth_type', str),
+    ('AUTH_USERNAME', 'auth_username', str),
+    ('AUTH_PASSWORD', 'auth_password', str),
+    ('AUTH_TOKEN', 'auth_token', str),
+    ('AUTH_API_KEY', 'auth_api_key', str),
+    ('AUTH_API_KEY_NAME', 'auth_api_key_name', str),
+    ('AUTH_API_KEY_IN', 'auth_api_key_in', str),
+    # Cognito authentication environment variables
+    ('AUTH_COGNITO_CLIENT_ID', 'auth_cognito_client_id', str),
+    ('AUTH_COGNITO_USERNAME', 'auth_cognito_username', str),
+    ('AUTH_COGNITO_PASSWORD', 'auth_cognito_password', str),
+    ('AUTH_COGNITO_USER_POOL_ID', 'auth_cognito_user_pool_id', str),
+    ('AUTH_COGNITO_REGION', 'auth_cognito_region', str),
+    # Server configuration
+    ('SERVER_PORT', 'port', int),
+    ('SSE_PORT', 'sse_port', int),
+    ('ENABLE_SSE', 'enable_sse', lambda v: v.lower() in ['true', '1', 'yes']),
+    ('ENABLE_HTTP', 'enable_http', lambda v: v.lower() in ['true', '1', 'yes']),
+    ('SERVER_HOST', 'host', str),
+    ('SERVER_PATH', 'path', str),
+    ('SERVER_DEBUG', 'debug', lambda v: v.lower() == 'true'),
+    ('SERVER_MESSAGE_TIMEOUT', 'message_timeout', int),
+)
+
+# Command line argument name and Config attribute
+_ARG_SPEC: Tuple[Tuple[str, str], ...] = (
+    # API information
+    ('api_name', 'api_name'),
+    ('api_url', 'api_base_url'),
+    ('spec_url', 'api_spec_url'),
+    ('spec_path', 'api_spec_path'),
+    # Server configuration
+    ('port', 'port'),
+    ('sse_port', 'sse_port'),
+    ('path', 'path'),
+    # Authentication arguments
+    ('auth_type', 'auth_type'),
+    ('auth_username', 'auth_username'),
+    ('auth_password', 'auth_password'),
+    ('auth_token', 'auth_token'),
+    ('auth_api_key', 'auth_api_key'),
+    ('auth_api_key_name', 'auth_api_key_name'),
+    ('auth_api_key_in', 'auth_api_key_in'),
+    # Cognito authentication arguments
+    ('auth_cognito_client_id', 'auth_cognito_client_id'),
+    ('auth_cognito_username', 'auth_cognito_username'),
+    ('auth_cognito_password', 'auth_cognito_password'),
+    ('auth_cognito_user_pool_id', 'auth_cognito_user_pool_id'),
+    ('auth_cognito_region', 'auth_cognito_region'),
+)
+
+# Enum-like fields that are compared against literals on hot paths
+_INTERNED_FIELDS: Tuple[str, ...] = ('auth_type', 'auth_api_key_in', 'host', 'path')
+
 def load_config(args: Any = None) -> Config:
     """Load configuration from arguments and environment variables.
 
@@ -77,147 +169,67 @@ def load_config(args: Any = None) -> Config:
     """
     logger.debug('Loading configuration')
 
-    # Get caller information for debugging
-    caller_info = get_caller_info()
-    logger.debug(f'Called from {caller_info}')
+    # Get caller information for debugging. Capturing the frame is cheap; the
+    # description is only built if a DEBUG sink wants it
+    caller_frame = sys._getframe(1)
+    logger.opt(lazy=True).debug('Called from {}', functools.partial(get_caller_info, caller_frame))
 
     # Create default config
     config = Config()
 
-    # Load from environment variables
-    env_vars = {
-        # API information
-        'API_NAME': (lambda v: setattr(config, 'api_name', v)),
-        'API_BASE_URL': (lambda v: setattr(config, 'api_base_url', v)),
-        'API_SPEC_URL': (lambda v: setattr(config, 'api_spec_url', v)),
-        'API_SPEC_PATH': (lambda v: setattr(config, 'api_spec_path', v)),
-        # Authentication
-        'AUTH_TYPE': (lambda v: setattr(config, 'auth_type', v)),
-        'AUTH_USERNAME': (lambda v: setattr(config, 'auth_username', v)),
-        'AUTH_PASSWORD': (lambda v: setattr(config, 'auth_password', v)),
-        'AUTH_TOKEN': (lambda v: setattr(config, 'auth_token', v)),
-        'AUTH_API_KEY': (lambda v: setattr(config, 'auth_api_key', v)),
-        'AUTH_API_KEY_NAME': (lambda v: setattr(config, 'auth_api_key_name', v)),
-        'AUTH_API_KEY_IN': (lambda v: setattr(config, 'auth_api_key_in', v)),
-        # Cognito authentication environment variables
-        'AUTH_COGNITO_CLIENT_ID': (lambda v: setattr(config, 'auth_cognito_client_id', v)),
-        'AUTH_COGNITO_USERNAME': (lambda v: setattr(config, 'auth_cognito_username', v)),
-        'AUTH_COGNITO_PASSWORD': (lambda v: setattr(config, 'auth_cognito_password', v)),
-        'AUTH_COGNITO_USER_POOL_ID': (lambda v: setattr(config, 'auth_cognito_user_pool_id', v)),
-        'AUTH_COGNITO_REGION': (lambda v: setattr(config, 'auth_cognito_region', v)),
-        # Server configuration
-        'SERVER_PORT': (lambda v: setattr(config, 'port', int(v))),
-        'SSE_PORT': (lambda v: setattr(config, 'sse_port', int(v))),
-        'ENABLE_SSE': (lambda v: setattr(config, 'enable_sse', v.lower() in ['true', '1', 'yes'])),
-        'SERVER_HOST': (lambda v: setattr(config, 'host', v)),
-        'SERVER_PATH': (lambda v: setattr(config, 'path', v)),
-        'SERVER_DEBUG': (lambda v: setattr(config, 'debug', v.lower() == 'true')),
-        'SERVER_MESSAGE_TIMEOUT': (lambda v: setattr(config, 'message_timeout', int(v))),
-    }
-
-    # Load environment variables
+    # Load environment variables from a single snapshot so each lookup is a plain
+    # dict access instead of going through os.environ's key encoding
+    environ = dict(os.environ)
     env_loaded = {}
-    for key, setter in env_vars.items():
-        if key in os.environ:
-            env_value = os.environ[key]
-            setter(env_value)
-            env_loaded[key] = env_value
+    for env_key, attr, convert in _ENV_SPEC:
+        env_value = environ.get(env_key)
+        if env_value is not None:
+            setattr(config, attr, convert(env_value))
+            env_loaded[env_key] = env_value
 
     if env_loaded:
-        logger.debug(
-            f'Loaded {len(env_loaded)} environment variables: {", ".join(env_loaded.keys())}'
+        logger.opt(lazy=True).debug(
+            'Loaded {} environment variables: {}',
+            lambda: len(env_loaded),
+            lambda: ', '.join(env_loaded),
         )
 
     # Load from arguments
     if args:
-        if hasattr(args, 'api_name') and args.api_name:
-            logger.debug(f'Setting API name from arguments: {args.api_name}')
-            config.api_name = args.api_name
-
-        if hasattr(args, 'api_url') and args.api_url:
-            logger.debug(f'Setting API base URL from arguments: {args.api_url}')
-            config.api_base_url = args.api_url
-
-        if hasattr(args, 'spec_url') and args.spec_url:
-            logger.debug(f'Setting API spec URL from arguments: {args.spec_url}')
-            config.api_spec_url = args.spec_url
-
-        if hasattr(args, 'spec_path') and args.spec_path:
-            logger.debug(f'Setting API spec path from arguments: {args.spec_path}')
-            config.api_spec_path = args.spec_path
-
-        if hasattr(args, 'port') and args.port:
-            logger.debug(f'Setting port from arguments: {args.port}')
-            config.port = args.port
-
-        if hasattr(args, 'sse_port') and args.sse_port:
-            logger.debug(f'Setting SSE port from arguments: {args.sse_port}')
-            config.sse_port = args.sse_port
-
-        if hasattr(args, 'enable_sse') and args.enable_sse:
-            logger.debug('Enabling SSE from arguments')
+        args_loaded = []
+        for arg_attr, attr in _ARG_SPEC:
+            arg_value = getattr(args, arg_attr, None)
+            if arg_value:
+                setattr(config, attr, arg_value)
+                args_loaded.append(attr)
+
+        if getattr(args, 'enable_sse', None):
             config.enable_sse = True
-        elif hasattr(args, 'disable_sse') and args.disable_sse:
-            logger.debug('Disabling SSE from arguments')
+            args_loaded.append('enable_sse')
+        elif getattr(args, 'disable_sse', None):
             config.enable_sse = False
+            args_loaded.append('enable_sse')
 
-        if hasattr(args, 'path') and args.path:
-            logger.debug(f'Setting path from arguments: {args.path}')
-            config.path = args.path
+        if getattr(args, 'disable_http', None):
+            config.enable_http = False
+            args_loaded.append('enable_http')
 
-        if hasattr(args, 'debug') and args.debug:
-            logger.debug('Setting debug mode from arguments')
+        if getattr(args, 'debug', None):
             config.debug = True
-
-        # Authentication arguments
-        if hasattr(args, 'auth_type') and args.auth_type:
-            logger.debug(f'Setting auth type from arguments: {args.auth_type}')
-            config.auth_type = args.auth_type
-
-        if hasattr(args, 'auth_username') and args.auth_username:
-            logger.debug('Setting auth username from arguments')
-            config.auth_username = args.auth_username
-
-        if hasattr(args, 'auth_password') and args.auth_password:
-            logger.debug('Setting auth password from arguments')
-            config.auth_password = args.auth_password
-
-        if hasattr(args, 'auth_token') and args.auth_token:
-            logger.debug('Setting auth token from arguments')
-            config.auth_token = args.auth_token
-
-        if hasattr(args, 'auth_api_key') and args.auth_api_key:
-            logger.debug('Setting auth API key from arguments')
-            config.auth_api_key = args.auth_api_key
-
-        if hasattr(args, 'auth_api_key_name') and args.auth_api_key_name:
-            logger.debug(f'Setting auth API key name from arguments: {args.auth_api_key_name}')
-            config.auth_api_key_name = args.auth_api_key_name
-
-        if hasattr(args, 'auth_api_key_in') and args.auth_api_key_in:
-            logger.debug(f'Setting auth API key location from arguments: {args.auth_api_key_in}')
-            config.auth_api_key_in = args.auth_api_key_in
-
-        # Cognito authentication arguments
-        if hasattr(args, 'auth_cognito_client_id') and args.auth_cognito_client_id:
-            logger.debug('Setting Cognito client ID from arguments')
-            config.auth_cognito_client_id = args.auth_cognito_client_id
-
-        if hasattr(args, 'auth_cognito_username') and args.auth_cognito_username:
-            logger.debug('Setting Cognito username from arguments')
-            config.auth_cognito_username = args.auth_cognito_username
-
-        if hasattr(args, 'auth_cognito_password') and args.auth_cognito_password:
-            logger.debug('Setting Cognito password from arguments')
-            config.auth_cognito_password = args.auth_cognito_password
-
-        if hasattr(args, 'auth_cognito_user_pool_id') and args.auth_cognito_user_pool_id:
-            logger.debug('Setting Cognito user pool ID from arguments')
-            config.auth_cognito_user_pool_id = args.auth_cognito_user_pool_id
-
-        if hasattr(args, 'auth_cognito_region') and args.auth_cognito_region:
-            logger.debug(f'Setting Cognito region from arguments: {args.auth_cognito_region}')
-            config.auth_cognito_region = args.auth_cognito_region
+            args_loaded.append('debug')
+
+        if args_loaded:
+            logger.opt(lazy=True).debug(
+                'Loaded {} settings from arguments: {}',
+                lambda: len(args_loaded),
+                lambda: ', '.join(args_loaded),
+            )
+
+    # Intern enum-like values so comparisons against literals can short-circuit on identity
+    for attr in _INTERNED_FIELDS:
+        value = getattr(config, attr)
+        if isinstance(value, str):
+            setattr(config, attr, sys.intern(value))
 
     # Log final configuration details
     logger.info(
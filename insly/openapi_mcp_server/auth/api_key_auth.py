@@ -23,16 +23,18 @@
 
 """API Key authentication provider."""
 
-import bcrypt
+import functools
+import hashlib
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.api.config import Config
 from insly.openapi_mcp_server.auth.auth_cache import cached_auth_data
 from insly.openapi_mcp_server.auth.auth_errors import (
+    AuthError,
     ConfigurationError,
     MissingCredentialsError,
 )
 from insly.openapi_mcp_server.auth.base_auth import BaseAuthProvider
-from typing import Dict
+from typing import Dict, Mapping, Optional, Tuple
 
 class ApiKeyAuthProvider(BaseAuthProvider):
     """API Key authentication provider.
@@ -41,6 +43,15 @@ class ApiKeyAuthProvider(BaseAuthProvider):
     query parameter, or cookie.
     """
 
+    provider_name = 'api_key'
+
+    # API key location -> (attribute holding the auth data, generator method name)
+    _LOCATION_TARGETS = {
+        'header': ('_auth_headers', '_generate_auth_headers'),
+        'query': ('_auth_params', '_generate_auth_params'),
+        'cookie': ('_auth_cookies', '_generate_auth_cookies'),
+    }
+
     def __init__(self, config: Config):
         """Initialize with configuration.
 
@@ -54,31 +65,29 @@ class ApiKeyAuthProvider(BaseAuthProvider):
         self._api_key_name = config.auth_api_key_name or 'api_key'
         self._api_key_in = config.auth_api_key_in or 'header'
         self._api_key_hash = None
+        self._auth_data_ready = False
 
         # Call parent initializer which will validate and initialize auth
         super().__init__(config)
 
-    def _validate_config(self) -> bool:
+    def _validate_config(self) -> Tuple[bool, Optional[AuthError]]:
         """Validate the configuration.
 
         Returns:
-            bool: True if API key is provided, False otherwise
-
-        Raises:
-            MissingCredentialsError: If API key is missing
-            ConfigurationError: If API key location is invalid
+            Tuple[bool, Optional[AuthError]]: (True, None) if API key is provided,
+                otherwise (False, error) describing the problem
 
         """
         if not self._api_key:
-            raise MissingCredentialsError(
+            return False, MissingCredentialsError(
                 'API Key authentication requires a valid API key',
                 {
                     'help': 'Provide it using --auth-api-key command line argument or AUTH_API_KEY environment variable'
                 },
             )
 
-        if self._api_key_in not in ('header', 'query', 'cookie'):
-            raise ConfigurationError(
+        if self._api_key_in not in self._LOCATION_TARGETS:
+            return False, ConfigurationError(
                 f'Invalid API key location: {self._api_key_in}',
                 {
                     'valid_locations': ['header', 'query', 'cookie'],
@@ -88,7 +97,7 @@ class ApiKeyAuthProvider(BaseAuthProvider):
 
         # Create a hash of the API key for caching
         self._api_key_hash = self._hash_api_key(self._api_key)
-        return True
+        return True, None
 
     def _handle_validation_error(self) -> None:
         """Handle validation error."""
@@ -103,19 +112,60 @@ class ApiKeyAuthProvider(BaseAuthProvider):
         self._log_auth_error(self._validation_error)
 
     def _initialize_auth(self) -> None:
-        """Initialize authentication data after validation."""
-        # Use cached methods to generate auth data based on location
-        if self._api_key_in == 'header':
-            self._auth_headers = self._generate_auth_headers(self._api_key_hash, self._api_key_name)
-        elif self._api_key_in == 'query':
-            self._auth_params = self._generate_auth_params(self._api_key_hash, self._api_key_name)
-        elif self._api_key_in == 'cookie':
-            self._auth_cookies = self._generate_auth_cookies(self._api_key_hash, self._api_key_name)
+        """Initialize authentication data after validation.
+
+        Auth data is generated lazily on first use so that providers which never
+        send a request do not pay for it.
+        """
+        self._auth_data_ready = False
+
+    def _ensure_auth_data(self) -> None:
+        """Generate authentication data on first use."""
+        if self._auth_data_ready or not self._is_valid:
+            return
+
+        # Use cached methods to generate auth data based on the validated location
+        attr, generator = self._LOCATION_TARGETS[self._api_key_in]
+        setattr(self, attr, getattr(self, generator)(self._api_key_hash, self._api_key_name))
+        self._auth_data_ready = True
+
+    def get_auth_headers(self) -> Mapping[str, str]:
+        """Get authentication headers for HTTP requests.
+
+        Returns:
+            Mapping[str, str]: Authentication headers
+
+        """
+        self._ensure_auth_data()
+        return super().get_auth_headers()
+
+    def get_auth_params(self) -> Mapping[str, str]:
+        """Get authentication query parameters for HTTP requests.
+
+        Returns:
+            Mapping[str, str]: Authentication query parameters
+
+        """
+        self._ensure_auth_data()
+        return super().get_auth_params()
+
+    def get_auth_cookies(self) -> Mapping[str, str]:
+        """Get authentication cookies for HTTP requests.
+
+        Returns:
+            Mapping[str, str]: Authentication cookies
+
+        """
+        self._ensure_auth_data()
+        return super().get_auth_cookies()
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _hash_api_key(api_key: str) -> str:
         """Create a hash of the API key for caching.
 
+        Results are memoized so providers rebuilt with the same key reuse the hash.
+
         Args:
             api_key: API key
 
@@ -123,8 +173,8 @@ class ApiKeyAuthProvider(BaseAuthProvider):
             str: Hash of the API key
 
         """
-        # Create a hash of the API key to use as a cache key
-        return bcrypt.hashpw(api_key.encode('utf-8'), bcrypt.gensalt(rounds=10)).hex()
+        # The hash is only used as a cache key, so a fast digest is sufficient
+        return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
 
     @cached_auth_data(ttl=3600)  # Cache for 1 hour by default
     def _generate_auth_headers(self, api_key_hash: str, api_key_name: str) -> Dict[str, str]:
@@ -140,9 +190,11 @@ class ApiKeyAuthProvider(BaseAuthProvider):
             Dict[str, str]: Authentication headers
 
         """
-        logger.debug(f'Generating new API key headers with name: {api_key_name}')
+        logger.debug('Generating new API key headers with name: {}', api_key_name)
         # Log key length for debugging without exposing the key
-        logger.debug(f'API key length: {len(self._api_key) if self._api_key else 0} characters')
+        logger.opt(lazy=True).debug(
+            'API key length: {} characters', lambda: len(self._api_key) if self._api_key else 0
+        )
         return {api_key_name: self._api_key}
 
     @cached_auth_data(ttl=3600)  # Cache for 1 hour by default
@@ -159,9 +211,11 @@ class ApiKeyAuthProvider(BaseAuthProvider):
             Dict[str, str]: Authentication query parameters
 
         """
-        logger.debug(f'Generating new API key query parameters with name: {api_key_name}')
+        logger.debug('Generating new API key query parameters with name: {}', api_key_name)
         # Log key length for debugging without exposing the key
-        logger.debug(f'API key length: {len(self._api_key) if self._api_key else 0} characters')
+        logger.opt(lazy=True).debug(
+            'API key length: {} characters', lambda: len(self._api_key) if self._api_key else 0
+        )
         return {api_key_name: self._api_key}
 
     @cached_auth_data(ttl=3600)  # Cache for 1 hour by default
@@ -178,17 +232,9 @@ class ApiKeyAuthProvider(BaseAuthProvider):
             Dict[str, str]: Authentication cookies
 
         """
-        logger.debug(f'Generating new API key cookies with name: {api_key_name}')
+        logger.debug('Generating new API key cookies with name: {}', api_key_name)
         # Log key length for debugging without exposing the key
-        logger.debug(f'API key length: {len(self._api_key) if self._api_key else 0} characters')
+        logger.opt(lazy=True).debug(
+            'API key length: {} characters', lambda: len(self._api_key) if self._api_key else 0
+        )
         return {api_key_name: self._api_key}
-
-    @property
-    def provider_name(self) -> str:
-        """Get the name of the authentication provider.
-
-        Returns:
-            str: Name of the authentication provider
-
-        """
-        return 'api_key'
@@ -26,8 +26,10 @@
 This module provides caching mechanisms for authentication tokens and other data.
 """
 
+import threading
 import time
-from typing import Any, Callable, Dict, Optional, TypeVar, cast
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar, cast
 
 # Type variable for cached function return types
 T = TypeVar('T')
@@ -35,8 +37,9 @@ T = TypeVar('T')
 class TokenCache:
     """Cache for authentication tokens and related data.
 
-    This class provides a simple time-based cache for authentication tokens
-    and other authentication-related data.
+    This class provides a time-based LRU cache for authentication tokens
+    and other authentication-related data. All operations are guarded by a
+    lock so the cache can be shared between concurrent requests.
     """
 
     def __init__(self, max_size: int = 100, ttl: int = 300):
@@ -47,11 +50,14 @@ class TokenCache:
             ttl: Time-to-live in seconds for cached items
 
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Entries are (expires_at, value) pairs on the monotonic clock.
+        # Insertion order tracks recency: least recently used entries come first
+        self._cache: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
         self._max_size = max_size
         self._ttl = ttl
+        self._lock = threading.Lock()
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get a value from the cache.
 
         Args:
@@ -61,18 +67,22 @@ class TokenCache:
             Any: Cached value or None if not found or expired
 
         """
-        if key not in self._cache:
-            return None
-
-        item = self._cache[key]
-        if time.time() > item['expires_at']:
-            # Item has expired
-            del self._cache[key]
-            return None
-
-        return item['value']
-
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            item = self._cache.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if now > expires_at:
+                # Item has expired
+                del self._cache[key]
+                return None
+
+            self._cache.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
         """Set a value in the cache.
 
         Args:
@@ -81,22 +91,21 @@ class TokenCache:
             ttl: Time-to-live in seconds (overrides default)
 
         """
-        # Ensure we don't exceed max size
-        if len(self._cache) >= self._max_size and key not in self._cache:
-            # Remove oldest item (simple LRU implementation)
-            oldest_key = min(self._cache.items(), key=lambda x: x[1]['expires_at'])[0]
-            del self._cache[oldest_key]
-
         # Calculate expiration time
-        expires_at = time.time() + (ttl if ttl is not None else self._ttl)
+        expires_at = time.monotonic() + (ttl if ttl is not None else self._ttl)
+
+        with self._lock:
+            if key in self._cache:
+                # Refresh recency of an existing entry
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self._max_size:
+                # Ensure we don't exceed max size by removing the least recently used item
+                self._cache.popitem(last=False)
 
-        # Store the item
-        self._cache[key] = {
-            'value': value,
-            'expires_at': expires_at,
-        }
+            # Store the item
+            self._cache[key] = (expires_at, value)
 
-    def delete(self, key: str) -> bool:
+    def delete(self, key: Hashable) -> bool:
         """Delete a value from the cache.
 
         Args:
@@ -106,14 +115,13 @@ class TokenCache:
             bool: True if the key was found and deleted, False otherwise
 
         """
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        with self._lock:
+            return self._cache.pop(key, None) is not None
 
     def clear(self) -> None:
         """Clear the entire cache."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def cleanup(self) -> int:
         """Remove expired items from the cache.
@@ -122,10 +130,11 @@ class TokenCache:
             int: Number of items removed
 
         """
-        now = time.time()
-        expired_keys = [k for k, v in self._cache.items() if now > v['expires_at']]
-        for key in expired_keys:
-            del self._cache[key]
+        now = time.monotonic()
+        with self._lock:
+            expired_keys = [k for k, (expires_at, _) in self._cache.items() if now > expires_at]
+            for key in expired_keys:
+                del self._cache[key]
         return len(expired_keys)
 
 # Global token cache instance
@@ -143,6 +152,10 @@ def get_token_cache() -> TokenCache:
 def cached_auth_data(ttl: int = 300) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Cache authentication data.
 
+    When decorating a method, the instance is keyed by ``id(self)`` so the global
+    cache does not keep providers alive. The cached data must therefore depend
+    only on the remaining arguments.
+
     Args:
         ttl: Time-to-live in seconds for cached items
 
@@ -162,6 +175,9 @@ def cached_auth_data(ttl: int = 300) -> Callable[[Callable[..., T]], Callable[..
 
         """
         cache = get_token_cache()
+        func_name = func.__name__
+        # Methods are detected once at decoration time from the first parameter name
+        is_method = func.__code__.co_varnames[:1] == ('self',)
 
         def wrapper(*args: Any, **kwargs: Any) -> T:
             """Wrap function with caching logic.
@@ -174,11 +190,13 @@ def cached_auth_data(ttl: int = 300) -> Callable[[Callable[..., T]], Callable[..
                 T: Function result
 
             """
-            # Create a cache key from the function name and arguments
-            key_parts = [func.__name__]
-            key_parts.extend(str(arg) for arg in args)
-            key_parts.extend(f'{k}={v}' for k, v in sorted(kwargs.items()))
-            cache_key = ':'.join(key_parts)
+            # Create a cache key from the function name and arguments; a tuple key
+            # avoids formatting and joining strings on every call
+            kwargs_key = tuple(sorted(kwargs.items())) if kwargs else ()
+            if is_method and args:
+                cache_key = (func_name, id(args[0]), args[1:], kwargs_key)
+            else:
+                cache_key = (func_name, args, kwargs_key)
 
             # Check if we have a cached result
             cached_result = cache.get(cache_key)
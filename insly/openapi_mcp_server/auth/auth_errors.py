@@ -26,11 +26,20 @@
 This module provides centralized error handling for authentication providers.
 """
 
+import functools
 from enum import Enum
-from typing import Dict, Optional, Type
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type
 
-class AuthErrorType(Enum):
-    """Authentication error types."""
+# Shared read-only details for errors created without any
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+class AuthErrorType(str, Enum):
+    """Authentication error types.
+
+    Members are their own string values, so they can be formatted without a
+    ``.value`` lookup.
+    """
 
     MISSING_CREDENTIALS = 'missing_credentials'
     INVALID_CREDENTIALS = 'invalid_credentials'
@@ -40,8 +49,25 @@ class AuthErrorType(Enum):
     NETWORK_ERROR = 'network_error'
     UNKNOWN_ERROR = 'unknown_error'
 
+    # Render as the plain value in str() and f-strings on every Python version
+    __str__ = str.__str__
+
+    # Definition-order index of the member, used for table dispatch
+    _ordinal: int
+
+# Assigned once the class exists, since iteration order is the documented definition order
+for _ordinal, _member in enumerate(AuthErrorType):
+    _member._ordinal = _ordinal
+del _ordinal, _member
+
 class AuthError(Exception):
-    """Base class for authentication errors."""
+    """Base class for authentication errors.
+
+    Error attributes live in ``__slots__``; subclasses declare empty slots so no
+    instance dict is allocated for them.
+    """
+
+    __slots__ = ('message', 'error_type', 'details')
 
     def __init__(
         self,
@@ -59,7 +85,7 @@ class AuthError(Exception):
         """
         self.message = message
         self.error_type = error_type
-        self.details = details or {}
+        self.details = details if details is not None else _NO_DETAILS
         super().__init__(message)
 
     def __str__(self) -> str:
@@ -69,10 +95,17 @@ class AuthError(Exception):
             str: Error message with type
 
         """
-        return f'{self.error_type.value}: {self.message}'
+        return self.error_type + f': {self.message}'
 
-class MissingCredentialsError(AuthError):
-    """Error raised when required credentials are missing."""
+class _TypedAuthError(AuthError):
+    """Base class for errors whose type is fixed by the class.
+
+    Subclasses set ``_error_type`` and share this single ``__init__``.
+    """
+
+    __slots__ = ()
+
+    _error_type: AuthErrorType = AuthErrorType.UNKNOWN_ERROR
 
     def __init__(self, message: str, details: Optional[Dict] = None):
         """Initialize the error.
@@ -82,80 +115,49 @@ class MissingCredentialsError(AuthError):
             details: Additional error details
 
         """
-        super().__init__(
-            message=message, error_type=AuthErrorType.MISSING_CREDENTIALS, details=details
-        )
+        super().__init__(message, self._error_type, details)
 
-class InvalidCredentialsError(AuthError):
-    """Error raised when credentials are invalid."""
+class MissingCredentialsError(_TypedAuthError):
+    """Error raised when required credentials are missing."""
 
-    def __init__(self, message: str, details: Optional[Dict] = None):
-        """Initialize the error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            details: Additional error details
+    _error_type = AuthErrorType.MISSING_CREDENTIALS
 
-        """
-        super().__init__(
-            message=message, error_type=AuthErrorType.INVALID_CREDENTIALS, details=details
-        )
+class InvalidCredentialsError(_TypedAuthError):
+    """Error raised when credentials are invalid."""
 
-class ExpiredTokenError(AuthError):
-    """Error raised when a token has expired."""
+    __slots__ = ()
 
-    def __init__(self, message: str, details: Optional[Dict] = None):
-        """Initialize the error.
+    _error_type = AuthErrorType.INVALID_CREDENTIALS
 
-        Args:
-            message: Error message
-            details: Additional error details
+class ExpiredTokenError(_TypedAuthError):
+    """Error raised when a token has expired."""
 
-        """
-        super().__init__(message=message, error_type=AuthErrorType.EXPIRED_TOKEN, details=details)
+    __slots__ = ()
 
-class InsufficientPermissionsError(AuthError):
-    """Error raised when permissions are insufficient."""
+    _error_type = AuthErrorType.EXPIRED_TOKEN
 
-    def __init__(self, message: str, details: Optional[Dict] = None):
-        """Initialize the error.
+class InsufficientPermissionsError(_TypedAuthError):
+    """Error raised when permissions are insufficient."""
 
-        Args:
-            message: Error message
-            details: Additional error details
+    __slots__ = ()
 
-        """
-        super().__init__(
-            message=message, error_type=AuthErrorType.INSUFFICIENT_PERMISSIONS, details=details
-        )
+    _error_type = AuthErrorType.INSUFFICIENT_PERMISSIONS
 
-class ConfigurationError(AuthError):
+class ConfigurationError(_TypedAuthError):
     """Error raised when there is a configuration issue."""
 
-    def __init__(self, message: str, details: Optional[Dict] = None):
-        """Initialize the error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            details: Additional error details
-
-        """
-        super().__init__(
-            message=message, error_type=AuthErrorType.CONFIGURATION_ERROR, details=details
-        )
+    _error_type = AuthErrorType.CONFIGURATION_ERROR
 
-class NetworkError(AuthError):
+class NetworkError(_TypedAuthError):
     """Error raised when there is a network issue."""
 
-    def __init__(self, message: str, details: Optional[Dict] = None):
-        """Initialize the error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            details: Additional error details
-
-        """
-        super().__init__(message=message, error_type=AuthErrorType.NETWORK_ERROR, details=details)
+    _error_type = AuthErrorType.NETWORK_ERROR
 
 # Map of error types to error classes
 ERROR_CLASSES: Dict[AuthErrorType, Type[AuthError]] = {
@@ -168,6 +170,17 @@ ERROR_CLASSES: Dict[AuthErrorType, Type[AuthError]] = {
     AuthErrorType.UNKNOWN_ERROR: AuthError,
 }
 
+def _unknown_error(message: str, details: Optional[Dict] = None) -> AuthError:
+    """Construct a base AuthError of the unknown type."""
+    return AuthError(message, AuthErrorType.UNKNOWN_ERROR, details)
+
+# Constructors taking (message, details), indexed by AuthErrorType._ordinal so
+# dispatch is a tuple read rather than a dict lookup through Enum.__hash__
+_ERROR_CTORS: Tuple[Callable[[str, Optional[Dict]], AuthError], ...] = tuple(
+    _unknown_error if ERROR_CLASSES[error_type] is AuthError else ERROR_CLASSES[error_type]
+    for error_type in AuthErrorType
+)
+
 def create_auth_error(
     error_type: AuthErrorType, message: str, details: Optional[Dict] = None
 ) -> AuthError:
@@ -182,15 +195,34 @@ def create_auth_error(
         AuthError: An instance of the appropriate error class
 
     """
-    error_class = ERROR_CLASSES.get(error_type, AuthError)
-    if error_class == AuthError:
-        # For the base class, we need to pass the error_type explicitly
-        return AuthError(message=message, error_type=error_type, details=details)
-    else:
-        # For subclasses, the error_type is already set in the constructor
-        return error_class(message=message, details=details)
-
-def format_error_message(provider_name: str, error_type: AuthErrorType, message: str) -> str:
+    try:
+        constructor = _ERROR_CTORS[error_type._ordinal]
+    except AttributeError:
+        # Not an AuthErrorType member
+        constructor = _unknown_error
+    return constructor(message, details)
+
+@functools.lru_cache(maxsize=128)
+def _format_prefix(provider_name: str, error_type: AuthErrorType) -> str:
+    """Build the provider/error-type prefix of a formatted error message.
+
+    Provider names and error types have a small cardinality, so the prefix is cached.
+
+    Args:
+        provider_name: Name of the authentication provider
+        error_type: Type of authentication error
+
+    Returns:
+        str: Message prefix such as ``'[BEARER] expired_token: '``
+
+    """
+    return f'[{provider_name.upper()}] {error_type}: '
+
+def format_error_message(
+    provider_name: str,
+    error_type: AuthErrorType,
+    message: str,
+) -> str:
     """Format an error message for consistent output.
 
     Args:
@@ -202,4 +234,4 @@ def format_error_message(provider_name: str, error_type: AuthErrorType, message:
         str: Formatted error message
 
     """
-    return f'[{provider_name.upper()}] {error_type.value}: {message}'
+    return _format_prefix(provider_name, error_type) + message
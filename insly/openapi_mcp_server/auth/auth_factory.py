@@ -29,11 +29,19 @@ from insly.openapi_mcp_server.auth.auth_protocol import AuthProviderProtocol
 from insly.openapi_mcp_server.auth.auth_provider import NullAuthProvider
 from typing import Any, Dict, Type
 
+# Bound logger methods used on every provider lookup
+_log_debug = logger.debug
+_log_info = logger.info
+_log_warning = logger.warning
+
 # Registry of authentication providers
 _AUTH_PROVIDERS: Dict[str, Type[Any]] = {'none': NullAuthProvider}
 
-# Cache for provider instances
+# Cache for provider instances, keyed by Config.auth_cache_key. Bounded like an
+# lru_cache: a hit moves the entry to the end, and when full the least recently
+# used entry at the front is dropped
 _PROVIDER_CACHE: Dict[int, AuthProviderProtocol] = {}
+_PROVIDER_CACHE_MAX_SIZE = 32
 
 def register_auth_provider(auth_type: str, provider_class: Type[Any]) -> None:
     """Register an authentication provider.
@@ -51,38 +59,36 @@ def register_auth_provider(auth_type: str, provider_class: Type[Any]) -> None:
         raise ValueError(f"Authentication provider for type '{auth_type}' already registered")
 
     _AUTH_PROVIDERS[auth_type] = provider_class
-    logger.debug(
+
+    _log_debug(
         f"Registered authentication provider for type '{auth_type}': {provider_class.__name__}"
     )
 
-def _get_provider_instance(
-    auth_type: str, config_hash: int, config: Config
-) -> AuthProviderProtocol:
-    """Get a cached provider instance or create a new one.
+def _config_cache_key(config: Config) -> int:
+    """Get the provider cache key for a configuration.
 
     Args:
-        auth_type: The authentication type
-        config_hash: Hash of the configuration to differentiate instances
         config: The configuration object
 
     Returns:
-        AuthProviderProtocol: The authentication provider instance
+        int: Hash of the auth-related configuration
 
     """
-    # Check if we have a cached instance
-    if config_hash in _PROVIDER_CACHE:
-        logger.debug(f'Using cached authentication provider for {auth_type}')
-        return _PROVIDER_CACHE[config_hash]
+    if isinstance(config, Config):
+        return config.auth_cache_key
 
-    # Create a new instance
-    provider_class = _AUTH_PROVIDERS[auth_type]
-    provider = provider_class(config)
-
-    # Cache the instance
-    _PROVIDER_CACHE[config_hash] = provider
-
-    logger.debug(f'Created new authentication provider: {provider.provider_name}')
-    return provider
+    # Duck-typed configs without auth_cache_key
+    return hash(
+        (
+            config.auth_type.lower(),
+            getattr(config, 'auth_token', None),
+            getattr(config, 'auth_username', None),
+            getattr(config, 'auth_password', None),
+            getattr(config, 'auth_api_key', None),
+            getattr(config, 'auth_api_key_name', None),
+            getattr(config, 'auth_api_key_in', None),
+        )
+    )
 
 def get_auth_provider(config: Config) -> AuthProviderProtocol:
     """Get an authentication provider based on configuration.
@@ -98,32 +104,29 @@ def get_auth_provider(config: Config) -> AuthProviderProtocol:
         Uses caching to avoid creating duplicate provider instances
 
     """
-    auth_type = config.auth_type.lower()
-
-    if auth_type not in _AUTH_PROVIDERS:
-        logger.warning(f"Unknown authentication type '{auth_type}'. Falling back to 'none'.")
-        auth_type = 'none'
-
-    # Create a hash of the relevant config parts for caching
-    config_hash = hash(
-        (
-            auth_type,
-            getattr(config, 'auth_token', None),
-            getattr(config, 'auth_username', None),
-            getattr(config, 'auth_password', None),
-            getattr(config, 'auth_api_key', None),
-            getattr(config, 'auth_api_key_name', None),
-            getattr(config, 'auth_api_key_in', None),
-        )
-    )
-
-    # Get or create provider instance
-    provider = _get_provider_instance(auth_type, config_hash, config)
+    config_hash = _config_cache_key(config)
+    # Popped and reinserted below, so dict order tracks recency of use
+    provider = _PROVIDER_CACHE.pop(config_hash, None)
+
+    if provider is None:
+        auth_type = config.auth_type.lower()
+
+        if auth_type not in _AUTH_PROVIDERS:
+            _log_warning(f"Unknown authentication type '{auth_type}'. Falling back to 'none'.")
+            auth_type = 'none'
+
+        provider = _AUTH_PROVIDERS[auth_type](config)
+        if len(_PROVIDER_CACHE) >= _PROVIDER_CACHE_MAX_SIZE:
+            del _PROVIDER_CACHE[next(iter(_PROVIDER_CACHE))]
+        _log_debug('Created new authentication provider: {}', provider.provider_name)
+    else:
+        _log_debug('Using cached authentication provider for {}', provider.provider_name)
+    _PROVIDER_CACHE[config_hash] = provider
 
-    logger.info(f'Created authentication provider: {provider.provider_name}')
+    _log_info('Created authentication provider: {}', provider.provider_name)
 
-    if not provider.is_configured() and auth_type != 'none':
-        logger.warning(
+    if not provider.is_configured() and provider.provider_name != 'none':
+        _log_warning(
             f"Authentication provider '{provider.provider_name}' is not properly configured"
         )
 
@@ -147,4 +150,4 @@ def clear_provider_cache() -> None:
     This is useful for testing or when configuration changes.
     """
     _PROVIDER_CACHE.clear()
-    logger.debug('Authentication provider cache cleared')
+    _log_debug('Authentication provider cache cleared')
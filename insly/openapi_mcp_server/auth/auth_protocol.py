@@ -25,8 +25,11 @@
 
 import httpx
 from insly.openapi_mcp_server.api.config import Config
-from typing import Dict, Optional, Protocol, TypeVar, runtime_checkable
+from typing import Mapping, Optional, Protocol, TypeVar, runtime_checkable
 
+# Runtime checks are part of the public contract for third-party providers. The
+# decorator costs nothing until isinstance() is called, and the package itself
+# never does that on a request path; prefer duck typing there.
 @runtime_checkable
 class AuthProviderProtocol(Protocol):
     """Protocol defining the interface for authentication providers.
@@ -43,15 +46,15 @@ class AuthProviderProtocol(Protocol):
         """Check if the authentication provider is properly configured."""
         ...
 
-    def get_auth_headers(self) -> Dict[str, str]:
+    def get_auth_headers(self) -> Mapping[str, str]:
         """Get authentication headers for HTTP requests."""
         ...
 
-    def get_auth_params(self) -> Dict[str, str]:
+    def get_auth_params(self) -> Mapping[str, str]:
         """Get authentication query parameters for HTTP requests."""
         ...
 
-    def get_auth_cookies(self) -> Dict[str, str]:
+    def get_auth_cookies(self) -> Mapping[str, str]:
         """Get authentication cookies for HTTP requests."""
         ...
 
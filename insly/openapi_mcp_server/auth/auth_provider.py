@@ -23,49 +23,51 @@
 
 """Base authentication provider interface."""
 
-import abc
 import httpx
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
-class AuthProvider(abc.ABC):
-    """Abstract base class for authentication providers.
+# Shared empty auth data returned by providers with nothing to add. Read-only, so
+# a caller mutating one provider's result cannot affect any other provider
+_EMPTY_MAPPING: Mapping[str, str] = MappingProxyType({})
+
+class AuthProvider:
+    """Base class for authentication providers.
 
     Authentication providers handle different authentication methods for APIs.
     Implementing classes must provide methods for setting up authentication
-    for HTTP requests.
+    for HTTP requests. The interface is checked structurally through
+    ``AuthProviderProtocol`` rather than an ABC metaclass; methods left
+    unimplemented raise ``NotImplementedError``.
     """
 
-    @abc.abstractmethod
-    def get_auth_headers(self) -> Dict[str, str]:
+    def get_auth_headers(self) -> Mapping[str, str]:
         """Get authentication headers for HTTP requests.
 
         Returns:
-            Dict[str, str]: Headers to include in HTTP requests
+            Mapping[str, str]: Headers to include in HTTP requests
 
         """
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def get_auth_params(self) -> Dict[str, str]:
+    def get_auth_params(self) -> Mapping[str, str]:
         """Get authentication query parameters for HTTP requests.
 
         Returns:
-            Dict[str, str]: Query parameters to include in HTTP requests
+            Mapping[str, str]: Query parameters to include in HTTP requests
 
         """
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def get_auth_cookies(self) -> Dict[str, str]:
+    def get_auth_cookies(self) -> Mapping[str, str]:
         """Get authentication cookies for HTTP requests.
 
         Returns:
-            Dict[str, str]: Cookies to include in HTTP requests
+            Mapping[str, str]: Cookies to include in HTTP requests
 
         """
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def get_httpx_auth(self) -> Optional[httpx.Auth]:
         """Get authentication object for HTTPX.
 
@@ -73,9 +75,8 @@ class AuthProvider(abc.ABC):
             Optional[httpx.Auth]: Authentication object for HTTPX client or None
 
         """
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def is_configured(self) -> bool:
         """Check if the authentication provider is properly configured.
 
@@ -83,18 +84,20 @@ class AuthProvider(abc.ABC):
             bool: True if configured, False otherwise
 
         """
-        pass
+        raise NotImplementedError
 
     @property
-    @abc.abstractmethod
     def provider_name(self) -> str:
         """Get the name of the authentication provider.
 
+        Concrete providers override this with a plain ``provider_name`` class
+        attribute, so reading it is an ordinary attribute lookup.
+
         Returns:
             str: Name of the authentication provider
 
         """
-        pass
+        raise NotImplementedError
 
 class NullAuthProvider(AuthProvider):
     """No-op authentication provider.
@@ -102,6 +105,8 @@ class NullAuthProvider(AuthProvider):
     This provider is used when authentication is disabled or not configured.
     """
 
+    provider_name = 'none'
+
     def __init__(self, config: Any = None):
         """Initialize with optional configuration.
 
@@ -112,32 +117,32 @@ class NullAuthProvider(AuthProvider):
         # Config is ignored by this provider
         pass
 
-    def get_auth_headers(self) -> Dict[str, str]:
+    def get_auth_headers(self) -> Mapping[str, str]:
         """Get authentication headers for HTTP requests.
 
         Returns:
-            Dict[str, str]: Empty dict as no authentication is provided
+            Mapping[str, str]: Empty mapping as no authentication is provided
 
         """
-        return {}
+        return _EMPTY_MAPPING
 
-    def get_auth_params(self) -> Dict[str, str]:
+    def get_auth_params(self) -> Mapping[str, str]:
         """Get authentication query parameters for HTTP requests.
 
         Returns:
-            Dict[str, str]: Empty dict as no authentication is provided
+            Mapping[str, str]: Empty mapping as no authentication is provided
 
         """
-        return {}
+        return _EMPTY_MAPPING
 
-    def get_auth_cookies(self) -> Dict[str, str]:
+    def get_auth_cookies(self) -> Mapping[str, str]:
         """Get authentication cookies for HTTP requests.
 
         Returns:
-            Dict[str, str]: Empty dict as no authentication is provided
+            Mapping[str, str]: Empty mapping as no authentication is provided
 
         """
-        return {}
+        return _EMPTY_MAPPING
 
     def get_httpx_auth(self) -> Optional[httpx.Auth]:
         """Get authentication object for HTTPX.
@@ -156,13 +161,3 @@ class NullAuthProvider(AuthProvider):
 
         """
         return True
-
-    @property
-    def provider_name(self) -> str:
-        """Get the name of the authentication provider.
-
-        Returns:
-            str: Name of the authentication provider
-
-        """
-        return 'none'
@@ -23,9 +23,7 @@
 
 """Base authentication provider."""
 
-import functools
 import httpx
-from abc import ABC, abstractmethod
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.api.config import Config
 from insly.openapi_mcp_server.auth.auth_errors import (
@@ -33,16 +31,20 @@ from insly.openapi_mcp_server.auth.auth_errors import (
     ConfigurationError,
     format_error_message,
 )
-from insly.openapi_mcp_server.auth.auth_provider import AuthProvider
-from typing import Any, Callable, Dict, Optional, TypeVar, cast
+from insly.openapi_mcp_server.auth.auth_provider import _EMPTY_MAPPING, AuthProvider
+from typing import Mapping, Optional, Tuple, Union
 
-# Type variable for method return types
-T = TypeVar('T')
+# Bound logger methods used when logging authentication errors
+_log_debug = logger.debug
+_log_error = logger.error
 
-class BaseAuthProvider(AuthProvider, ABC):
+# Result of _validate_config: a bool, or (is_valid, error to raise)
+ValidationResult = Union[bool, Tuple[bool, Optional[AuthError]]]
+
+class BaseAuthProvider(AuthProvider):
     """Base authentication provider.
 
-    This abstract base class provides common functionality for all authentication providers.
+    This base class provides common functionality for all authentication providers.
     It implements the Template Method pattern for configuration validation and error handling.
     """
 
@@ -55,32 +57,48 @@ class BaseAuthProvider(AuthProvider, ABC):
         """
         self._config = config
         self._is_valid = False
-        self._auth_headers: Dict[str, str] = {}
-        self._auth_params: Dict[str, str] = {}
-        self._auth_cookies: Dict[str, str] = {}
+        self._auth_headers: Mapping[str, str] = {}
+        self._auth_params: Mapping[str, str] = {}
+        self._auth_cookies: Mapping[str, str] = {}
         self._validation_error: Optional[AuthError] = None
 
-        # Template method pattern: validate and initialize
+        # Template method pattern: validate and initialize. Validators report
+        # failures by returning an error, so the common failure path raises once
         try:
-            self._is_valid = self._validate_config()
-            if self._is_valid:
-                self._initialize_auth()
-            else:
-                self._handle_validation_error()
+            result = self._validate_config()
+            is_valid, error = result if isinstance(result, tuple) else (result, None)
+            if error is None:
+                self._is_valid = is_valid
+                if is_valid:
+                    self._initialize_auth()
+                else:
+                    self._handle_validation_error()
+                return
         except AuthError as e:
-            self._validation_error = e
-            self._is_valid = False
-            self._log_auth_error(e)
+            self._record_init_error(e)
             # Re-raise the exception for test cases to catch
-            raise e
+            raise
         except Exception as e:
-            self._validation_error = ConfigurationError(
-                f'Unexpected error during authentication provider initialization: {str(e)}'
+            error = ConfigurationError(
+                f'Unexpected error during authentication provider initialization: {e}'
             )
-            self._is_valid = False
-            self._log_auth_error(self._validation_error)
+            self._record_init_error(error)
             # Re-raise the exception for test cases to catch
-            raise self._validation_error
+            raise error from e
+
+        self._record_init_error(error)
+        raise error
+
+    def _record_init_error(self, error: AuthError) -> None:
+        """Mark the provider invalid and log the error that stopped initialization.
+
+        Args:
+            error: The authentication error
+
+        """
+        self._validation_error = error
+        self._is_valid = False
+        self._log_auth_error(error)
 
     def _initialize_auth(self) -> None:
         """Initialize authentication data after validation.
@@ -90,18 +108,17 @@ class BaseAuthProvider(AuthProvider, ABC):
         """
         pass
 
-    @abstractmethod
-    def _validate_config(self) -> bool:
+    def _validate_config(self) -> ValidationResult:
         """Validate the configuration.
 
         Returns:
-            bool: True if configuration is valid, False otherwise
-
-        Raises:
-            AuthError: If validation fails with a specific error
+            ValidationResult: ``(True, None)`` if the configuration is valid, or
+                ``(False, error)`` with the error to raise. A plain bool is also
+                accepted, in which case a False result is handled by
+                ``_handle_validation_error``
 
         """
-        pass
+        raise NotImplementedError
 
     def _handle_validation_error(self) -> None:
         """Handle validation error.
@@ -122,71 +139,42 @@ class BaseAuthProvider(AuthProvider, ABC):
 
         """
         message = format_error_message(self.provider_name, error.error_type, error.message)
-        logger.error(message)
+        _log_error(message)
 
         # Log additional details at debug level
         if error.details:
-            logger.debug(f'Error details: {error.details}')
-
-    def _log_validation_error(self) -> None:
-        """Log validation error messages.
+            _log_debug('Error details: {}', error.details)
 
-        This method is kept for backward compatibility.
-        New implementations should use _handle_validation_error instead.
-        """
-        self._handle_validation_error()
-
-    def _requires_valid_config(method: Callable[..., T]) -> Callable[..., T]:  # type: ignore
-        """Ensure a method is only called with valid configuration.
-
-        If the configuration is not valid, returns an empty result.
-        """
-
-        @functools.wraps(method)
-        def wrapper(self: 'BaseAuthProvider', *args: Any, **kwargs: Any) -> T:
-            if not self._is_valid:
-                # Return empty result based on return type annotation
-                return_type = method.__annotations__.get('return')
-                if return_type == Dict[str, str]:
-                    return cast(T, {})
-                elif return_type == Optional[httpx.Auth]:
-                    return cast(T, None)
-                return cast(T, None)
-            return method(self, *args, **kwargs)
-
-        return wrapper
-
-    @_requires_valid_config
-    def get_auth_headers(self) -> Dict[str, str]:
+    def get_auth_headers(self) -> Mapping[str, str]:
         """Get authentication headers for HTTP requests.
 
         Returns:
-            Dict[str, str]: Authentication headers
+            Mapping[str, str]: Authentication headers, or an empty mapping if the
+                configuration is invalid
 
         """
-        return self._auth_headers
+        return self._auth_headers if self._is_valid else _EMPTY_MAPPING
 
-    @_requires_valid_config
-    def get_auth_params(self) -> Dict[str, str]:
+    def get_auth_params(self) -> Mapping[str, str]:
         """Get authentication query parameters for HTTP requests.
 
         Returns:
-            Dict[str, str]: Authentication query parameters
+            Mapping[str, str]: Authentication query parameters, or an empty mapping if
+                the configuration is invalid
 
         """
-        return self._auth_params
+        return self._auth_params if self._is_valid else _EMPTY_MAPPING
 
-    @_requires_valid_config
-    def get_auth_cookies(self) -> Dict[str, str]:
+    def get_auth_cookies(self) -> Mapping[str, str]:
         """Get authentication cookies for HTTP requests.
 
         Returns:
-            Dict[str, str]: Authentication cookies
+            Mapping[str, str]: Authentication cookies, or an empty mapping if the
+                configuration is invalid
 
         """
-        return self._auth_cookies
+        return self._auth_cookies if self._is_valid else _EMPTY_MAPPING
 
-    @_requires_valid_config
     def get_httpx_auth(self) -> Optional[httpx.Auth]:
         """Get authentication object for HTTPX.
 
@@ -213,14 +201,3 @@ class BaseAuthProvider(AuthProvider, ABC):
 
         """
         return self._validation_error
-
-    @property
-    @abstractmethod
-    def provider_name(self) -> str:
-        """Get the name of the authentication provider.
-
-        Returns:
-            str: Name of the authentication provider
-
-        """
-        pass
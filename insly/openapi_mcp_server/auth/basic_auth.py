@@ -23,14 +23,19 @@
 
 """Basic authentication provider."""
 
-import base64
 import httpx
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.api.config import Config
-from insly.openapi_mcp_server.auth.auth_cache import cached_auth_data
-from insly.openapi_mcp_server.auth.auth_errors import MissingCredentialsError
+from insly.openapi_mcp_server.auth.auth_errors import AuthError, MissingCredentialsError
 from insly.openapi_mcp_server.auth.base_auth import BaseAuthProvider
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Optional, Tuple
+
+# Use the SIMD base64 codec when it's installed; it's API-compatible with the stdlib
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore[no-redef]
 
 class BasicAuthProvider(BaseAuthProvider):
     """Basic authentication provider.
@@ -39,6 +44,8 @@ class BasicAuthProvider(BaseAuthProvider):
     to all HTTP requests.
     """
 
+    provider_name = 'basic'
+
     def __init__(self, config: Config):
         """Initialize with configuration.
 
@@ -50,23 +57,20 @@ class BasicAuthProvider(BaseAuthProvider):
         self._username = config.auth_username
         self._password = config.auth_password
         self._httpx_auth: Optional[httpx.Auth] = None
-        self._credentials_hash = None
 
         # Call parent initializer which will validate and initialize auth
         super().__init__(config)
 
-    def _validate_config(self) -> bool:
+    def _validate_config(self) -> Tuple[bool, Optional[AuthError]]:
         """Validate the configuration.
 
         Returns:
-            bool: True if username and password are provided, False otherwise
-
-        Raises:
-            MissingCredentialsError: If username or password is missing
+            Tuple[bool, Optional[AuthError]]: (True, None) if username and password
+                are provided, otherwise (False, error) describing the problem
 
         """
         if not self._username:
-            raise MissingCredentialsError(
+            return False, MissingCredentialsError(
                 'Basic authentication requires a username',
                 {
                     'help': 'Provide a username using --auth-username command line argument or AUTH_USERNAME environment variable'
@@ -74,16 +78,14 @@ class BasicAuthProvider(BaseAuthProvider):
             )
 
         if not self._password:
-            raise MissingCredentialsError(
+            return False, MissingCredentialsError(
                 'Basic authentication requires a password',
                 {
                     'help': 'Provide a password using --auth-password command line argument or AUTH_PASSWORD environment variable'
                 },
             )
 
-        # Create a hash of the credentials for caching
-        self._credentials_hash = self._hash_credentials(self._username, self._password)
-        return True
+        return True, None
 
     def _log_validation_error(self) -> None:
         """Log validation error messages."""
@@ -92,73 +94,20 @@ class BasicAuthProvider(BaseAuthProvider):
         )
 
     def _initialize_auth(self) -> None:
-        """Initialize authentication data after validation."""
-        # Use cached methods to generate auth data
-        self._auth_headers = self._generate_auth_headers(self._credentials_hash)
-        self._httpx_auth = self._generate_httpx_auth(self._username, self._password)
-
-    @staticmethod
-    def _hash_credentials(username: str, password: str) -> str:
-        """Create a hash of the credentials for caching.
-
-        Args:
-            username: Username
-            password: Password
-
-        Returns:
-            str: Hash of the credentials
-
-        """
-        # Create a hash of the credentials to use as a cache key
-        # This avoids storing the actual credentials in the cache key
-        # Using bcrypt for stronger security
-        import bcrypt
-
-        credentials = f'{username}:{password}'
-        # Generate a salt and hash the credentials
-        # We only need a string representation for caching, so we'll use the hexdigest of the hash
-        hashed = bcrypt.hashpw(credentials.encode('utf-8'), bcrypt.gensalt(rounds=10))
-        # Convert to hex string for consistent cache key format
-        return hashed.hex()
-
-    @cached_auth_data(ttl=3600)  # Cache for 1 hour by default
-    def _generate_auth_headers(self, credentials_hash: str) -> Dict[str, str]:
-        """Generate authentication headers.
-
-        This method is cached to avoid regenerating headers for the same credentials.
-
-        Args:
-            credentials_hash: Hash of the credentials
-
-        Returns:
-            Dict[str, str]: Authentication headers
-
-        """
-        logger.debug(f'Generating new basic auth headers for user: {self._username}')
-
-        # Create the basic auth header
-        auth_string = f'{self._username}:{self._password}'
-        auth_bytes = auth_string.encode('utf-8')
-        encoded_auth = base64.b64encode(auth_bytes).decode('utf-8')
-
-        return {'Authorization': f'Basic {encoded_auth}'}
-
-    @cached_auth_data(ttl=3600)  # Cache for 1 hour by default
-    def _generate_httpx_auth(self, username: str, password: str) -> httpx.BasicAuth:
-        """Generate HTTPX auth object.
-
-        This method is cached to avoid regenerating auth objects for the same credentials.
-
-        Args:
-            username: Username
-            password: Password
-
-        Returns:
-            httpx.BasicAuth: HTTPX auth object
+        """Initialize authentication data after validation.
 
+        Credentials are fixed for the provider's lifetime, so the header and the
+        HTTPX auth object are built once here.
         """
-        logger.debug(f'Generating new HTTPX basic auth object for user: {username}')
-        return httpx.BasicAuth(username=username, password=password)
+        logger.debug('Generating basic auth headers for user: {}', self._username)
+        # Encode each credential once; HTTPX takes the bytes as-is instead of re-encoding
+        username = self._username.encode('utf-8')
+        password = self._password.encode('utf-8')
+        credentials = username + b':' + password
+        auth_value = f'Basic {base64.b64encode(credentials).decode("ascii")}'
+        # Read-only view, so the headers can be shared with callers without copying
+        self._auth_headers = MappingProxyType({'Authorization': auth_value})
+        self._httpx_auth = httpx.BasicAuth(username=username, password=password)
 
     def get_httpx_auth(self) -> Optional[httpx.Auth]:
         """Get authentication object for HTTPX.
@@ -168,13 +117,3 @@ class BasicAuthProvider(BaseAuthProvider):
 
         """
         return self._httpx_auth
-
-    @property
-    def provider_name(self) -> str:
-        """Get the name of the authentication provider.
-
-        Returns:
-            str: Name of the authentication provider
-
-        """
-        return 'basic'
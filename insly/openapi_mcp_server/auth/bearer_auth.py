@@ -25,10 +25,10 @@
 
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.api.config import Config
-from insly.openapi_mcp_server.auth.auth_cache import cached_auth_data
-from insly.openapi_mcp_server.auth.auth_errors import MissingCredentialsError
+from insly.openapi_mcp_server.auth.auth_errors import AuthError, MissingCredentialsError
 from insly.openapi_mcp_server.auth.base_auth import BaseAuthProvider
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 class BearerAuthProvider(BaseAuthProvider):
     """Bearer token authentication provider.
@@ -37,6 +37,8 @@ class BearerAuthProvider(BaseAuthProvider):
     to all HTTP requests.
     """
 
+    provider_name = 'bearer'
+
     def __init__(self, config: Config):
         """Initialize with configuration.
 
@@ -51,24 +53,22 @@ class BearerAuthProvider(BaseAuthProvider):
         # Call parent initializer which will validate and initialize auth
         super().__init__(config)
 
-    def _validate_config(self) -> bool:
+    def _validate_config(self) -> Tuple[bool, Optional[AuthError]]:
         """Validate the configuration.
 
         Returns:
-            bool: True if token is provided, False otherwise
-
-        Raises:
-            MissingCredentialsError: If token is missing
+            Tuple[bool, Optional[AuthError]]: (True, None) if token is provided,
+                otherwise (False, error) describing the problem
 
         """
         if not self._token:
-            raise MissingCredentialsError(
+            return False, MissingCredentialsError(
                 'Bearer authentication requires a valid token',
                 {
                     'help': 'Provide a token using --auth-token command line argument or AUTH_TOKEN environment variable'
                 },
             )
-        return True
+        return True, None
 
     def _log_validation_error(self) -> None:
         """Log validation error messages."""
@@ -81,37 +81,25 @@ class BearerAuthProvider(BaseAuthProvider):
 
     def _initialize_auth(self) -> None:
         """Initialize authentication data after validation."""
-        # We'll use the cached method to generate headers
         self._auth_headers = self._generate_auth_headers(self._token)
 
-    @cached_auth_data(ttl=3600)  # Cache for 1 hour by default
-    def _generate_auth_headers(self, token: str) -> Dict[str, str]:
+    def _generate_auth_headers(self, token: str) -> Mapping[str, str]:
         """Generate authentication headers.
 
-        This method is cached to avoid regenerating headers for the same token.
+        Headers are built once per token, when the provider is initialized or the
+        token is refreshed, and shared with every request as a read-only mapping.
 
         Args:
             token: Bearer token
 
         Returns:
-            Dict[str, str]: Authentication headers
+            Mapping[str, str]: Read-only authentication headers
 
         """
         # Log without including the token
         logger.debug('Generating new bearer token headers')
 
-        # Calculate token length for debugging purposes
-        token_length = len(token) if token else 0
-        logger.debug(f'Token length: {token_length} characters')
-
-        return {'Authorization': f'Bearer {token}'}
-
-    @property
-    def provider_name(self) -> str:
-        """Get the name of the authentication provider.
+        # Log token length for debugging
+        logger.debug('Token length: {} characters', len(token or ''))
 
-        Returns:
-            str: Name of the authentication provider
-
-        """
-        return 'bearer'
+        return MappingProxyType({'Authorization': 'Bearer ' + token})
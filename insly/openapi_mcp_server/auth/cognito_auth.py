@@ -29,6 +29,7 @@ import time
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.api.config import Config
 from insly.openapi_mcp_server.auth.auth_errors import (
+    AuthError,
     ConfigurationError,
     ExpiredTokenError,
     InvalidCredentialsError,
@@ -36,7 +37,7 @@ from insly.openapi_mcp_server.auth.auth_errors import (
     NetworkError,
 )
 from insly.openapi_mcp_server.auth.bearer_auth import BearerAuthProvider
-from typing import Dict, Optional
+from typing import Mapping, Optional, Tuple
 
 class CognitoAuthProvider(BearerAuthProvider):
     """Cognito User Pool authentication provider.
@@ -46,6 +47,8 @@ class CognitoAuthProvider(BearerAuthProvider):
     to all HTTP requests.
     """
 
+    provider_name = 'cognito'
+
     def __init__(self, config: Config):
         """Initialize with configuration.
 
@@ -91,20 +94,17 @@ class CognitoAuthProvider(BearerAuthProvider):
         # This will set self._token from config.auth_token
         super().__init__(config)
 
-    def _validate_config(self) -> bool:
+    def _validate_config(self) -> Tuple[bool, Optional[AuthError]]:
         """Validate the configuration.
 
         Returns:
-            bool: True if all required parameters are provided, False otherwise
-
-        Raises:
-            MissingCredentialsError: If required parameters are missing
-            ConfigurationError: If configuration is invalid
+            Tuple[bool, Optional[AuthError]]: (True, None) if all required parameters
+                are provided, otherwise (False, error) describing the problem
 
         """
         # Validate required parameters
         if not self._client_id:
-            raise MissingCredentialsError(
+            return False, MissingCredentialsError(
                 'Cognito authentication requires a client ID',
                 {
                     'help': 'Provide client ID using --auth-cognito-client-id command line argument or AUTH_COGNITO_CLIENT_ID environment variable'
@@ -112,7 +112,7 @@ class CognitoAuthProvider(BearerAuthProvider):
             )
 
         if not self._username:
-            raise MissingCredentialsError(
+            return False, MissingCredentialsError(
                 'Cognito authentication requires a username',
                 {
                     'help': 'Provide username using --auth-cognito-username command line argument or AUTH_COGNITO_USERNAME environment variable'
@@ -120,7 +120,7 @@ class CognitoAuthProvider(BearerAuthProvider):
             )
 
         if not self._password:
-            raise MissingCredentialsError(
+            return False, MissingCredentialsError(
                 'Cognito authentication requires a password',
                 {
                     'help': 'Provide password using --auth-cognito-password command line argument or AUTH_COGNITO_PASSWORD environment variable'
@@ -138,11 +138,11 @@ class CognitoAuthProvider(BearerAuthProvider):
             'and password using --auth-cognito-password command line arguments or corresponding environment variables.'
         )
 
-    def get_auth_headers(self) -> Dict[str, str]:
+    def get_auth_headers(self) -> Mapping[str, str]:
         """Get authentication headers with auto-refresh.
 
         Returns:
-            Dict[str, str]: Authentication headers
+            Mapping[str, str]: Authentication headers
 
         """
         # Check if token needs refreshing and refresh if necessary
@@ -179,12 +179,12 @@ class CognitoAuthProvider(BearerAuthProvider):
 
             # Try using refresh token if available
             if self._refresh_token_value:
-                logger.debug(f'Attempting to refresh Cognito token for user: {self._username}')
+                logger.debug('Attempting to refresh Cognito token for user: {}', self._username)
                 new_token = self._refresh_cognito_token()
 
             # If refresh failed or no refresh token available, re-authenticate
             if not new_token:
-                logger.debug(f'Re-authenticating Cognito user: {self._username}')
+                logger.debug('Re-authenticating Cognito user: {}', self._username)
                 new_token = self._get_cognito_token()
 
             # Update token if we got a new one
@@ -214,19 +214,23 @@ class CognitoAuthProvider(BearerAuthProvider):
         client = boto3.client('cognito-idp', region_name=self._region)
 
         try:
-            logger.debug(f'Authenticating with Cognito for user: {self._username}')
+            logger.debug('Authenticating with Cognito for user: {}', self._username)
 
             # Log parameters for debugging (without sensitive info)
-            logger.debug(f'Initiating auth with ClientId: {self._client_id}')
+            logger.debug('Initiating auth with ClientId: {}', self._client_id)
             logger.debug('AuthFlow: USER_PASSWORD_AUTH')
-            logger.debug(f'USERNAME parameter provided: {self._username}')
-            logger.debug(
-                f'PASSWORD parameter provided: {"*" * (len(self._password) if self._password else 0)}'
+            logger.debug('USERNAME parameter provided: {}', self._username)
+            # The mask is only built if a DEBUG sink wants the message
+            logger.opt(lazy=True).debug(
+                'PASSWORD parameter provided: {}', lambda: '*' * len(self._password or '')
             )
 
             # Add clear confirmation of required variables
             logger.debug(
-                f'Cognito auth configuration: Username={self._username}, ClientID={self._client_id}, Password={"SET" if self._password else "NOT SET"}'
+                'Cognito auth configuration: Username={}, ClientID={}, Password={}',
+                self._username,
+                self._client_id,
+                'SET' if self._password else 'NOT SET',
             )
 
             # Try with different parameter formats
@@ -235,7 +239,7 @@ class CognitoAuthProvider(BearerAuthProvider):
 
             # Add user pool ID if provided (some configurations might require this)
             if self._user_pool_id:
-                logger.debug(f'User pool ID provided: {self._user_pool_id}')
+                logger.debug('User pool ID provided: {}', self._user_pool_id)
                 # Some Cognito configurations might use this format
                 auth_params['UserPoolId'] = self._user_pool_id
 
@@ -252,7 +256,7 @@ class CognitoAuthProvider(BearerAuthProvider):
                 # This requires user pool ID
                 if self._user_pool_id:
                     logger.debug('USER_PASSWORD_AUTH failed, trying ADMIN_USER_PASSWORD_AUTH flow')
-                    logger.debug(f'Using user pool ID: {self._user_pool_id}')
+                    logger.debug('Using user pool ID: {}', self._user_pool_id)
 
                     # ADMIN_USER_PASSWORD_AUTH requires admin credentials
                     # This will use the AWS credentials from the environment
@@ -289,8 +293,7 @@ class CognitoAuthProvider(BearerAuthProvider):
                 logger.info(f'Obtained new Cognito ID token for user: {self._username}')
 
                 # Log token length for debugging
-                token_length = len(id_token) if id_token else 0
-                logger.debug(f'Token length: {token_length} characters')
+                logger.debug('Token length: {} characters', len(id_token or ''))
 
                 return id_token
             else:
@@ -414,7 +417,7 @@ class CognitoAuthProvider(BearerAuthProvider):
         client = boto3.client('cognito-idp', region_name=self._region)
 
         try:
-            logger.debug(f'Refreshing token for user: {self._username}')
+            logger.debug('Refreshing token for user: {}', self._username)
 
             # Try with standard REFRESH_TOKEN_AUTH flow first
             try:
@@ -429,7 +432,7 @@ class CognitoAuthProvider(BearerAuthProvider):
                 # This requires user pool ID
                 if self._user_pool_id:
                     logger.debug('REFRESH_TOKEN_AUTH failed, trying ADMIN_REFRESH_TOKEN_AUTH flow')
-                    logger.debug(f'Using user pool ID: {self._user_pool_id}')
+                    logger.debug('Using user pool ID: {}', self._user_pool_id)
 
                     # ADMIN_REFRESH_TOKEN_AUTH requires admin credentials
                     # This will use the AWS credentials from the environment
@@ -463,8 +466,7 @@ class CognitoAuthProvider(BearerAuthProvider):
                 logger.info(f'Successfully refreshed Cognito ID token for user: {self._username}')
 
                 # Log token length for debugging
-                token_length = len(id_token) if id_token else 0
-                logger.debug(f'Token length: {token_length} characters')
+                logger.debug('Token length: {} characters', len(id_token or ''))
 
                 return id_token
             else:
@@ -535,13 +537,3 @@ class CognitoAuthProvider(BearerAuthProvider):
             logger.warning(f'Failed to extract token expiry: {e}')
             # Default to 1 hour from now if extraction fails
             return int(time.time()) + 3600
-
-    @property
-    def provider_name(self) -> str:
-        """Get the name of the authentication provider.
-
-        Returns:
-            str: Name of the authentication provider
-
-        """
-        return 'cognito'
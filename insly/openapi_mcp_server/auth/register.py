@@ -25,7 +25,16 @@
 
 import os
 from insly.openapi_mcp_server import logger
-from insly.openapi_mcp_server.auth.auth_factory import register_auth_provider
+from insly.openapi_mcp_server.auth.auth_factory import _AUTH_PROVIDERS, register_auth_provider
+from typing import Dict, Tuple
+
+# Auth type -> (provider module, provider class name), imported on demand
+_PROVIDER_MODULES: Dict[str, Tuple[str, str]] = {
+    'bearer': ('insly.openapi_mcp_server.auth.bearer_auth', 'BearerAuthProvider'),
+    'basic': ('insly.openapi_mcp_server.auth.basic_auth', 'BasicAuthProvider'),
+    'api_key': ('insly.openapi_mcp_server.auth.api_key_auth', 'ApiKeyAuthProvider'),
+    'cognito': ('insly.openapi_mcp_server.auth.cognito_auth', 'CognitoAuthProvider'),
+}
 
 def register_auth_providers() -> None:
     """Register authentication providers based on configuration.
@@ -34,73 +43,84 @@ def register_auth_providers() -> None:
     by the AUTH_TYPE environment variable or command-line argument.
     If no auth type is specified, it registers all available providers.
     """
-    # Get the auth type from environment variable
-    auth_type = os.environ.get('AUTH_TYPE', '').lower()
+    # Read at call time rather than import time, so changes to the environment
+    # made before registration are honoured
+    auth_type = os.environ.get('AUTH_TYPE', '').strip().lower()
 
-    # If no auth type is specified in the environment, register all providers
-    if not auth_type:
-        logger.debug('No auth type specified in environment, registering all providers')
-        register_all_providers()
-    else:
+    if auth_type in _PROVIDER_MODULES:
         # Register only the specified provider
         register_provider_by_type(auth_type)
+    elif auth_type:
+        logger.warning(f'Unknown auth type: {auth_type}, registering all providers')
+        register_all_providers()
+    else:
+        logger.debug('No auth type specified in environment, registering all providers')
+        register_all_providers()
 
 def register_provider_by_type(auth_type: str) -> None:
     """Register a specific authentication provider by type.
 
+    Only the module for the requested provider is imported. Registering a type
+    that is already registered with the same class is a no-op.
+
     Args:
         auth_type: The type of authentication provider to register
 
     """
-    if auth_type == 'bearer':
-        from insly.openapi_mcp_server.auth.bearer_auth import BearerAuthProvider
-
-        register_auth_provider('bearer', BearerAuthProvider)
-        logger.info('Registered Bearer authentication provider')
-    elif auth_type == 'basic':
-        from insly.openapi_mcp_server.auth.basic_auth import BasicAuthProvider
-
-        register_auth_provider('basic', BasicAuthProvider)
-        logger.info('Registered Basic authentication provider')
-    elif auth_type == 'api_key':
-        from insly.openapi_mcp_server.auth.api_key_auth import ApiKeyAuthProvider
-
-        register_auth_provider('api_key', ApiKeyAuthProvider)
-        logger.info('Registered Api_Key authentication provider')
-    elif auth_type == 'cognito':
-        from insly.openapi_mcp_server.auth.cognito_auth import CognitoAuthProvider
-
-        register_auth_provider('cognito', CognitoAuthProvider)
-        logger.info('Registered Cognito authentication provider')
-    else:
+    if auth_type not in _PROVIDER_MODULES:
         logger.warning(f'Unknown auth type: {auth_type}, registering all providers')
         register_all_providers()
+        return
+
+    _register(auth_type)
 
 def register_all_providers() -> None:
     """Register all available authentication providers."""
-    # Import all provider classes
-    from insly.openapi_mcp_server.auth.api_key_auth import ApiKeyAuthProvider
-    from insly.openapi_mcp_server.auth.basic_auth import BasicAuthProvider
-    from insly.openapi_mcp_server.auth.bearer_auth import BearerAuthProvider
+    registered = []
+    for auth_type in _PROVIDER_MODULES:
+        try:
+            if _register(auth_type, log=False):
+                registered.append(auth_type)
+        except ImportError:
+            # Only Cognito has optional dependencies (boto3)
+            if auth_type != 'cognito':
+                raise
+            logger.debug('Cognito authentication provider not available')
+
+    if registered:
+        logger.info('Registered authentication providers: {}', ', '.join(registered))
+
+def _register(auth_type: str, log: bool = True) -> bool:
+    """Import and register the provider class for a known auth type.
+
+    The registry is checked before importing, so an already registered provider
+    costs neither an import lookup nor a log call.
 
-    # Register the standard providers
-    register_auth_provider('bearer', BearerAuthProvider)
-    logger.info('Registered Bearer authentication provider')
-
-    register_auth_provider('basic', BasicAuthProvider)
-    logger.info('Registered Basic authentication provider')
+    Args:
+        auth_type: A key of ``_PROVIDER_MODULES``
+        log: Whether to log the registration
 
-    register_auth_provider('api_key', ApiKeyAuthProvider)
-    logger.info('Registered Api_Key authentication provider')
+    Returns:
+        bool: True if the provider was registered, False if it already was
 
-    # Only register Cognito if it's available
-    try:
-        from insly.openapi_mcp_server.auth.cognito_auth import CognitoAuthProvider
+    Raises:
+        ImportError: If the provider module cannot be imported
 
-        register_auth_provider('cognito', CognitoAuthProvider)
-        logger.info('Registered Cognito authentication provider')
-    except ImportError:
-        logger.debug('Cognito authentication provider not available')
+    """
+    module_name, class_name = _PROVIDER_MODULES[auth_type]
+    current = _AUTH_PROVIDERS.get(auth_type)
+    if (
+        current is not None
+        and current.__module__ == module_name
+        and current.__qualname__ == class_name
+    ):
+        return False
+
+    provider_class = getattr(__import__(module_name, fromlist=[class_name]), class_name)
+    register_auth_provider(auth_type, provider_class)
+    if log:
+        logger.info(f'Registered {auth_type.title()} authentication provider')
+    return True
 
 # Don't register providers automatically when this module is imported
 # This will be done explicitly in server.py
@@ -23,86 +23,126 @@
 
 """Multi-transport support for running both streamable-http and SSE transports."""
 
-import multiprocessing
-import signal
+import anyio
+import asyncio
+import functools
 import sys
+from fastmcp import FastMCP
 from typing import Optional
 
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.api.config import Config
-from insly.openapi_mcp_server.server import create_mcp_server
+from insly.openapi_mcp_server.server import create_mcp_server, serve_and_close_client
 
+# Seconds the remaining transport gets to finish shutting down after the first one stops
+_SHUTDOWN_GRACE_SECONDS = 5
 
-def run_sse_server(config: Config) -> None:
+
+def run_sse_server(config: Config, server: Optional[FastMCP] = None) -> None:
     """Run SSE transport server on separate port.
     
     Args:
         config: Server configuration
+        server: Already created MCP server; one is created from the config if omitted
     """
     try:
         logger.info(f'Starting SSE server on http://{config.host}:{config.sse_port}')
-        server = create_mcp_server(config)
-        server.run(transport="sse", host=config.host, port=config.sse_port)
+        if server is None:
+            server = create_mcp_server(config)
+        anyio.run(
+            serve_and_close_client,
+            functools.partial(server.run_async, transport="sse", host=config.host, port=config.sse_port),
+        )
     except Exception as e:
         logger.error(f'SSE server error: {e}')
         sys.exit(1)
 
 
-def run_dual_transport(config: Config) -> None:
-    """Run both streamable-http and SSE transports.
+async def _serve_dual_transport(server: FastMCP, config: Config) -> None:
+    """Serve streamable-http and SSE from one server on the running event loop.
+
+    Each transport gets its own uvicorn server. Both chain their signal
+    handlers, so a shutdown signal stops them in turn. If one fails, the
+    other is cancelled and the error is re-raised.
     
     Args:
+        server: MCP server shared by both transports
         config: Server configuration
     """
-    sse_process: Optional[multiprocessing.Process] = None
-    
-    def signal_handler(sig, frame):
-        """Handle shutdown signals gracefully."""
-        logger.info('Shutting down multi-transport server...')
-        if sse_process and sse_process.is_alive():
-            sse_process.terminate()
-            sse_process.join(timeout=5)
-        sys.exit(0)
+    tasks = [
+        asyncio.create_task(
+            server.run_async(
+                transport="streamable-http",
+                host=config.host,
+                port=config.port,
+                path=config.path
+            ),
+            name='mcp-streamable-http'
+        ),
+        asyncio.create_task(
+            server.run_async(transport="sse", host=config.host, port=config.sse_port),
+            name='mcp-sse'
+        ),
+    ]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        if pending and not any(task.exception() for task in done):
+            # A clean exit means a shutdown signal, which the other server also
+            # received; give it time to shut down gracefully before cancelling it
+            await asyncio.wait(pending, timeout=_SHUTDOWN_GRACE_SECONDS)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in done:
+        task.result()
+
+
+def run_dual_transport(config: Config, server: Optional[FastMCP] = None) -> None:
+    """Run both streamable-http and SSE transports.
     
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    Both transports are served by a single process and event loop, sharing
+    the parsed OpenAPI spec and server state.
     
+    Args:
+        config: Server configuration
+        server: Already created MCP server, so startup does not build it twice;
+            one is created from the config if omitted
+
+    """
+    if config.enable_sse and not config.enable_http:
+        # Only one transport to serve, so run it directly
+        logger.info('Streamable-http transport disabled, running SSE only')
+        run_sse_server(config, server)
+        return
+
     try:
+        if server is None:
+            server = create_mcp_server(config)
         if config.enable_sse:
             logger.info('Starting dual transport mode (streamable-http + SSE)')
-            
-            # Start SSE server in separate process
-            sse_process = multiprocessing.Process(
-                target=run_sse_server,
-                args=(config,),
-                name='mcp-sse-server'
-            )
-            sse_process.start()
-            logger.info(f'SSE server process started (PID: {sse_process.pid})')
+            logger.info(f'Starting SSE server on http://{config.host}:{config.sse_port}')
+            logger.info(f'Starting streamable-http server on http://{config.host}:{config.port}{config.path}')
+            # Run the loop the same way FastMCP.run does
+            anyio.run(serve_and_close_client, functools.partial(_serve_dual_transport, server, config))
         else:
             logger.info('SSE transport disabled, running streamable-http only')
+            logger.info(f'Starting streamable-http server on http://{config.host}:{config.port}{config.path}')
+            anyio.run(
+                serve_and_close_client,
+                functools.partial(
+                    server.run_async,
+                    transport="streamable-http",
+                    host=config.host,
+                    port=config.port,
+                    path=config.path
+                ),
+            )
         
-        # Run main streamable-http server in main process
-        logger.info(f'Starting streamable-http server on http://{config.host}:{config.port}{config.path}')
-        server = create_mcp_server(config)
-        server.run(
-            transport="streamable-http",
-            host=config.host,
-            port=config.port,
-            path=config.path
-        )
-        
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # anyio reports Ctrl+C by cancelling the main task rather than raising KeyboardInterrupt
         logger.info('Received keyboard interrupt')
     except Exception as e:
         logger.error(f'Multi-transport server error: {e}')
     finally:
-        # Clean up SSE process if running
-        if sse_process and sse_process.is_alive():
-            logger.info('Terminating SSE server process...')
-            sse_process.terminate()
-            sse_process.join(timeout=5)
-            if sse_process.is_alive():
-                logger.warning('SSE server did not terminate gracefully, forcing...')
-                sse_process.kill()
\ No newline at end of file
+        logger.info('Shutting down multi-transport server...')
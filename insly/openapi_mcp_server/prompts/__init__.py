@@ -23,6 +23,26 @@
 
 """MCP prompt generation for OpenAPI specifications."""
 
-from insly.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
+from typing import Any
 
 __all__ = ['MCPPromptManager']
+
+def __getattr__(name: str) -> Any:
+    """Import the prompt manager on first access.
+
+    Importing ``prompts.models`` or ``prompts.generators`` on their own then no
+    longer pulls in every generator module.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Any: The exported attribute
+
+    """
+    if name == 'MCPPromptManager':
+        from insly.openapi_mcp_server.prompts.prompt_manager import MCPPromptManager
+
+        globals()[name] = MCPPromptManager
+        return MCPPromptManager
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -23,10 +23,41 @@
 
 """Generators for MCP prompts."""
 
-from insly.openapi_mcp_server.prompts.generators.operation_prompts import create_operation_prompt
-from insly.openapi_mcp_server.prompts.generators.workflow_prompts import (
-    identify_workflows,
-    create_workflow_prompt,
-)
+from typing import Any
+
+# Exported name -> defining submodule. Submodules are only imported when one of
+# their names is first accessed (PEP 562), keeping the package import cheap.
+_LAZY_EXPORTS = {
+    'create_operation_prompt': 'insly.openapi_mcp_server.prompts.generators.operation_prompts',
+    'identify_workflows': 'insly.openapi_mcp_server.prompts.generators.workflow_prompts',
+    'create_workflow_prompt': 'insly.openapi_mcp_server.prompts.generators.workflow_prompts',
+}
 
 __all__ = ['create_operation_prompt', 'identify_workflows', 'create_workflow_prompt']
+
+def __getattr__(name: str) -> Any:
+    """Import exported generators on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Any: The exported generator function
+
+    """
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(__import__(module, fromlist=[name]), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    """List module attributes including the lazily imported exports.
+
+    Returns:
+        list: Attribute names
+
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -543,7 +543,7 @@ def create_operation_prompt(
                     }
                 )
 
-            logger.debug(f'Operation {operation_id} returning {len(messages)} messages')
+            logger.debug('Operation {} returning {} messages', operation_id, len(messages))
             return messages
 
         # Create a function with the correct signature using functools.partial
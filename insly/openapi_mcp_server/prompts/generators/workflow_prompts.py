@@ -253,7 +253,7 @@ def create_workflow_prompt(server: Any, workflow: Dict[str, Any]) -> bool:
 
             # Add the prompt to the server
             server._prompt_manager.add_prompt(prompt)
-            logger.debug(f'Added workflow prompt: {workflow["name"]}')
+            logger.debug('Added workflow prompt: {}', workflow['name'])
             return True
         else:
             logger.warning('Server does not have _prompt_manager')
@@ -21,51 +21,100 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Data models for MCP prompts."""
+"""Data models for MCP prompts.
 
-from pydantic import BaseModel, Field
+The models are immutable value objects: they are built once per prompt and never
+modified afterwards, so they are frozen and reject unknown fields.
+"""
+
+import sys
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Any, Dict, List, Literal, Optional, Union
 
-class PromptArgument(BaseModel):
+# The content type, MIME type and role fields only ever take a handful of values,
+# so every instance shares one interned string per value
+_TEXT = sys.intern('text')
+_RESOURCE = sys.intern('resource')
+_JSON = sys.intern('application/json')
+
+def _intern(value: Any) -> Any:
+    """Intern string field values so equal values share one object.
+
+    Args:
+        value: Raw field value
+
+    Returns:
+        Any: The interned string, or the value unchanged if it is not a string
+
+    """
+    return sys.intern(value) if type(value) is str else value
+
+class _PromptModel(BaseModel):
+    """Base class for the prompt models."""
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    def json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes, omitting unset optional fields.
+
+        Goes straight through pydantic-core's serializer, skipping both the
+        intermediate dict and the bytes-to-str decode of ``model_dump_json``.
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
+class PromptArgument(_PromptModel):
     """Argument for an MCP prompt."""
 
     name: str = Field(..., description='Unique identifier for the argument')
     description: Optional[str] = Field(None, description='Human-readable description')
     required: bool = Field(False, description='Whether the argument is required')
 
-    def dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        result = {'name': self.name, 'required': self.required}
-        if self.description:
-            result['description'] = self.description
-        return result
+    def dict(self) -> Dict[str, Any]:  # type: ignore[override]
+        """Convert to dictionary representation.
+
+        Serialization is delegated to pydantic-core; an empty description is
+        dropped along with a missing one.
 
-class ResourceContent(BaseModel):
+        Returns:
+            Dict[str, Any]: The argument's name, required flag and optional description
+
+        """
+        return self.model_dump(exclude=None if self.description else {'description'})
+
+class ResourceContent(_PromptModel):
     """Content for a resource message."""
 
     uri: str = Field(..., description='URI of the resource')
-    mimeType: str = Field('application/json', description='MIME type of the resource')
+    mimeType: str = Field(_JSON, description='MIME type of the resource')
     text: Optional[str] = Field(None, description='Text content of the resource')
 
-class TextMessage(BaseModel):
+    _intern_mime_type = field_validator('mimeType', mode='before')(_intern)
+
+class TextMessage(_PromptModel):
     """Text message content."""
 
-    type: Literal['text'] = Field('text', description='Type of message content')
+    type: Literal['text'] = Field(_TEXT, description='Type of message content')
     text: str = Field(..., description='Text content')
 
-class ResourceMessage(BaseModel):
+class ResourceMessage(_PromptModel):
     """Resource message content."""
 
-    type: Literal['resource'] = Field('resource', description='Type of message content')
+    type: Literal['resource'] = Field(_RESOURCE, description='Type of message content')
     resource: ResourceContent = Field(..., description='Resource content')
 
-class PromptMessage(BaseModel):
+class PromptMessage(_PromptModel):
     """Message in an MCP prompt."""
 
     role: str = Field(..., description='Role of the message sender')
     content: Union[TextMessage, ResourceMessage] = Field(..., description='Content of the message')
 
-class MCPPrompt(BaseModel):
+    _intern_role = field_validator('role', mode='before')(_intern)
+
+class MCPPrompt(_PromptModel):
     """MCP-compliant prompt definition."""
 
     name: str = Field(..., description='Unique identifier for the prompt')
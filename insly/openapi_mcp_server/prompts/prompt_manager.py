@@ -23,13 +23,39 @@
 
 """MCP prompt manager for OpenAPI specifications."""
 
+import re
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.prompts.generators.operation_prompts import create_operation_prompt
 from insly.openapi_mcp_server.prompts.generators.workflow_prompts import (
     create_workflow_prompt,
     identify_workflows,
 )
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
+
+# Path template placeholder, e.g. ``{petId}``
+_PATH_PARAM_RE = re.compile(r'\{([^}]+)\}')
+
+# HTTP methods that get an operation prompt
+_HTTP_METHODS = frozenset(('get', 'post', 'put', 'patch', 'delete'))
+
+# Smallest number of operations a workflow is built from
+_MIN_WORKFLOW_OPERATIONS = 2
+
+def _iter_operations(paths: Dict[str, Any]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """Iterate over the operations of an OpenAPI ``paths`` object.
+
+    Args:
+        paths: OpenAPI paths object
+
+    Yields:
+        Tuple[str, str, Dict[str, Any]]: Path, HTTP method and operation for each
+            supported method
+
+    """
+    for path, path_item in paths.items():
+        for method, operation in path_item.items():
+            if method in _HTTP_METHODS:
+                yield path, method, operation
 
 class MCPPromptManager:
     """Manager for MCP-compliant prompts."""
@@ -63,46 +89,50 @@ class MCPPromptManager:
         # Track generation status
         status = {'operation_prompts_generated': False, 'workflow_prompts_generated': False}
 
-        # Generate operation prompts
+        # Generate operation prompts. Prompt creation is synchronous, CPU-bound
+        # work that registers into the server's prompt table, so the operations
+        # are processed in spec order on the calling task rather than fanned out
         operation_count = 0
+        operations_seen = 0
+
+        get_friendly_name = (mcp_names or {}).get
+
+        for path, method, operation in _iter_operations(paths):
+            operations_seen += 1
+            op_get = operation.get
+            operation_id = op_get('operationId')
+            if not operation_id:
+                continue
+
+            # Create and register operation prompt
+            success = create_operation_prompt(
+                server=server,
+                api_name=api_name,
+                operation_id=operation_id,
+                friendly_name=get_friendly_name(operation_id),
+                method=method,
+                path=path,
+                summary=op_get('summary', ''),
+                description=op_get('description', ''),
+                parameters=op_get('parameters', []),
+                request_body=op_get('requestBody'),
+                responses=op_get('responses', {}),
+                security=op_get('security', []),
+                paths=paths,
+            )
 
-        for path, path_item in paths.items():
-            for method, operation in path_item.items():
-                if method not in ['get', 'post', 'put', 'patch', 'delete']:
-                    continue
-
-                operation_id = operation.get('operationId')
-                if not operation_id:
-                    continue
-
-                # Get friendly name if available
-                friendly_name = None
-                if mcp_names and operation_id in mcp_names:
-                    friendly_name = mcp_names[operation_id]
-
-                # Create and register operation prompt
-                success = create_operation_prompt(
-                    server=server,
-                    api_name=api_name,
-                    operation_id=operation_id,
-                    friendly_name=friendly_name,
-                    method=method,
-                    path=path,
-                    summary=operation.get('summary', ''),
-                    description=operation.get('description', ''),
-                    parameters=operation.get('parameters', []),
-                    request_body=operation.get('requestBody'),
-                    responses=operation.get('responses', {}),
-                    security=operation.get('security', []),
-                    paths=paths,
-                )
-
-                if success:
-                    operation_count += 1
+            if success:
+                operation_count += 1
 
         status['operation_prompts_generated'] = operation_count > 0
         logger.info(f'Generated {operation_count} operation prompts')
 
+        # Every workflow chains at least two operations, so skip the second scan
+        # of the paths for specs that cannot contain one
+        if operations_seen < _MIN_WORKFLOW_OPERATIONS:
+            logger.info('Too few operations for workflows; skipping workflow prompts')
+            return status
+
         # Generate workflow prompts
         workflows = identify_workflows(paths)
         workflow_count = 0
@@ -127,16 +157,20 @@ class MCPPromptManager:
             client: HTTP client for making API requests
 
         """
+        uri_prefix = f'api://{api_name}'
 
         async def api_resource_handler(uri: str, params: Dict[str, Any]) -> Dict[str, Any]:
             """Handle API resource requests."""
             # Extract path from URI
             # Format: api://api_name/path/to/resource
-            path = uri.split(f'api://{api_name}')[1]
+            path = uri.removeprefix(uri_prefix)
 
-            # Substitute path parameters
-            for param_name, param_value in params.items():
-                path = path.replace(f'{{{param_name}}}', str(param_value))
+            # Substitute path parameters in one pass; unknown placeholders are kept
+            if '{' in path:
+                path = _PATH_PARAM_RE.sub(
+                    lambda m: str(params[m.group(1)]) if m.group(1) in params else m.group(0),
+                    path,
+                )
 
             try:
                 # Make the API request using the authenticated client
@@ -153,7 +187,7 @@ class MCPPromptManager:
                 return {'text': f'Error: {str(e)}', 'mimeType': 'text/plain'}
 
         # Store the resource handler for later use
-        resource_uri = f'api://{api_name}/'
+        resource_uri = f'{uri_prefix}/'
         self.resource_handlers[resource_uri] = api_resource_handler
 
         # Try to register the resource handler if the server supports it
@@ -23,25 +23,64 @@
 
 """insly openapi MCP Server implementation."""
 
+import anyio
 import argparse
 import asyncio
+import functools
 import httpx
 import re
 import signal
 import sys
 
 # Import from our modules - use direct imports from sub-modules for better patching in tests
-from insly.openapi_mcp_server import logger
+from insly.openapi_mcp_server import configure_logging, is_debug_enabled, logger
 from insly.openapi_mcp_server.api.config import Config, load_config
-from insly.openapi_mcp_server.prompts import MCPPromptManager
-from insly.openapi_mcp_server.utils.http_client import HttpClientFactory, make_request_with_retry
+from insly.openapi_mcp_server.utils.http_client import (
+    HTTP2_AVAILABLE,
+    HttpClientFactory,
+    make_request_with_retry,
+)
+from insly.openapi_mcp_server.utils.config import HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE
 from insly.openapi_mcp_server.utils.metrics_provider import metrics
 from insly.openapi_mcp_server.utils.openapi import load_openapi_spec
 from insly.openapi_mcp_server.utils.openapi_validator import validate_openapi_spec
-from insly.openapi_mcp_server.utils.tool_naming import generate_mcp_names, validate_tool_names
-from insly.openapi_mcp_server.utils.description_enhancer import enhance_tool_descriptions
 from fastmcp import FastMCP
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Startup error shown when the configured auth provider is missing its credentials
+_AUTH_ERROR_MESSAGES: Dict[str, str] = {
+    'bearer': 'Bearer authentication requires a valid token. Please provide a token using --auth-token command line argument or AUTH_TOKEN environment variable.',
+    'basic': 'Basic authentication requires both username and password. Please provide them using --auth-username and --auth-password command line arguments or AUTH_USERNAME and AUTH_PASSWORD environment variables.',
+    'api_key': 'API Key authentication requires a valid API key. Please provide it using --auth-api-key command line argument or AUTH_API_KEY environment variable.',
+    'cognito': 'Cognito authentication requires client ID, username, and password. Please provide them using --auth-cognito-client-id, --auth-cognito-username, and --auth-cognito-password command line arguments or corresponding environment variables.',
+}
+
+# API client of the most recently created server, closed when serving stops
+_API_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Upper bound on how long shutdown waits for in-flight API requests to drain
+_CLIENT_CLOSE_TIMEOUT = 2.0
+
+@functools.lru_cache(maxsize=16)
+def _ensure_auth_registered(auth_type: str) -> bool:
+    """Register the provider for an auth type and check that it is available.
+
+    Registration may import the provider module, so the outcome is memoized per
+    auth type and repeated server creation skips the import and registry lookups.
+
+    Args:
+        auth_type: Authentication type from the configuration
+
+    Returns:
+        bool: True if a provider is registered for the auth type
+
+    """
+    from insly.openapi_mcp_server.auth import is_auth_type_available
+    from insly.openapi_mcp_server.auth.register import register_provider_by_type
+
+    logger.debug('Registering authentication provider for type: {}', auth_type)
+    register_provider_by_type(auth_type)
+    return is_auth_type_available(auth_type)
 
 def create_mcp_server(config: Config) -> FastMCP:
     """Create and configure the FastMCP server.
@@ -84,20 +123,17 @@ def create_mcp_server(config: Config) -> FastMCP:
             raise ValueError('API base URL must be provided')
 
         # Configure authentication using the auth factory
-        from insly.openapi_mcp_server.auth import get_auth_provider, is_auth_type_available
-
-        # Import and register the specific auth provider
-        from insly.openapi_mcp_server.auth.register import register_provider_by_type
+        from insly.openapi_mcp_server.auth import get_auth_provider
 
         # Register only the provider we need
         if config.auth_type and config.auth_type != 'none':
-            logger.debug(f'Registering authentication provider for type: {config.auth_type}')
-            register_provider_by_type(config.auth_type)
+            auth_available = _ensure_auth_registered(config.auth_type)
         else:
             logger.debug('No authentication type specified, using none')
+            auth_available = config.auth_type == 'none'
 
-        # Check if the requested auth type is available
-        if config.auth_type != 'none' and not is_auth_type_available(config.auth_type):
+        # Fall back to no authentication if the requested auth type is not available
+        if not auth_available:
             logger.warning(
                 f'Authentication type {config.auth_type} is not available. Falling back to none.'
             )
@@ -131,26 +167,9 @@ def create_mcp_server(config: Config) -> FastMCP:
 
         # Check if the provider is properly configured
         if not auth_provider.is_configured() and config.auth_type != 'none':
-            if config.auth_type == 'bearer':
-                handle_auth_error(
-                    'bearer',
-                    'Bearer authentication requires a valid token. Please provide a token using --auth-token command line argument or AUTH_TOKEN environment variable.',
-                )
-            elif config.auth_type == 'basic':
-                handle_auth_error(
-                    'basic',
-                    'Basic authentication requires both username and password. Please provide them using --auth-username and --auth-password command line arguments or AUTH_USERNAME and AUTH_PASSWORD environment variables.',
-                )
-            elif config.auth_type == 'api_key':
-                handle_auth_error(
-                    'api_key',
-                    'API Key authentication requires a valid API key. Please provide it using --auth-api-key command line argument or AUTH_API_KEY environment variable.',
-                )
-            elif config.auth_type == 'cognito':
-                handle_auth_error(
-                    'cognito',
-                    'Cognito authentication requires client ID, username, and password. Please provide them using --auth-cognito-client-id, --auth-cognito-username, and --auth-cognito-password command line arguments or corresponding environment variables.',
-                )
+            error_message = _AUTH_ERROR_MESSAGES.get(config.auth_type)
+            if error_message:
+                handle_auth_error(config.auth_type, error_message)
             else:
                 logger.warning(
                     'Continuing with incomplete authentication configuration. This may cause API requests to fail.'
@@ -168,12 +187,20 @@ def create_mcp_server(config: Config) -> FastMCP:
             base_url=config.api_base_url,
             default_headers=auth_headers,
             auth=httpx_auth,
-            cookies=auth_cookies,
+            # Providers may return a read-only mapping; httpx treats anything that is
+            # not a dict, list or Cookies as a CookieJar
+            cookies=dict(auth_cookies),
             # Pass through other client configuration from HttpClientFactory
             timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            ),
             follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
         )
+        global _API_CLIENT
+        _API_CLIENT = client
         logger.info(f'Created DynamicAuthClient for API base URL: {config.api_base_url} (supports per-request Bearer tokens)')
 
         # Update API name from OpenAPI spec title if available
@@ -183,6 +210,11 @@ def create_mcp_server(config: Config) -> FastMCP:
                 logger.info(f'Updated API name from OpenAPI spec title: {config.api_name}')
 
         # Generate meaningful tool names from OpenAPI metadata
+        from insly.openapi_mcp_server.utils.tool_naming import (
+            generate_mcp_names,
+            validate_tool_names,
+        )
+
         logger.info('Generating tool name mappings from OpenAPI specification')
         try:
             mcp_names = generate_mcp_names(openapi_spec)
@@ -203,17 +235,26 @@ def create_mcp_server(config: Config) -> FastMCP:
 
         logger.info(f'Successfully configured API: {config.api_name}')
 
-        # Enhance tool descriptions with header parameter information
+        # Enhance tool descriptions with header parameter information. This and the
+        # prompt generation below are CPU-bound walks without I/O, so they run back
+        # to back; overlapping them in threads would only add GIL contention
         try:
+            from insly.openapi_mcp_server.utils.description_enhancer import (
+                enhance_tool_descriptions,
+            )
+
             logger.info('Enhancing tool descriptions with header parameter information')
             enhance_tool_descriptions(server, openapi_spec)
         except Exception as e:
             logger.warning(f'Failed to enhance tool descriptions: {e}')
-            import traceback
-            logger.warning(f'Traceback: {traceback.format_exc()}')
+            logger.opt(exception=True).warning('Tool description enhancement error details')
 
         # Generate MCP-compliant prompts
         try:
+            # The prompt package pulls in the pydantic prompt models, so it is only
+            # imported once a server is actually being built
+            from insly.openapi_mcp_server.prompts import MCPPromptManager
+
             logger.info(f'Generating MCP prompts for API: {config.api_name}')
             # Create prompt manager
             prompt_manager = MCPPromptManager()
@@ -226,9 +267,7 @@ def create_mcp_server(config: Config) -> FastMCP:
 
         except Exception as e:
             logger.warning(f'Failed to generate operation-specific prompts: {e}')
-            import traceback
-
-            logger.warning(f'Traceback: {traceback.format_exc()}')
+            logger.opt(exception=True).warning('Prompt generation error details')
 
         # Register health check tool
         async def health_check() -> Dict[str, Any]:
@@ -276,9 +315,7 @@ def create_mcp_server(config: Config) -> FastMCP:
     except Exception as e:
         logger.error(f'Error setting up API: {e}')
         logger.error('Server shutting down due to API setup error.')
-        import traceback
-
-        logger.error(f'Traceback: {traceback.format_exc()}')
+        logger.opt(exception=True).error('API setup error details')
         sys.exit(1)
 
     # Move the logging here, after the server is fully initialized
@@ -286,8 +323,11 @@ def create_mcp_server(config: Config) -> FastMCP:
     tool_count = 0
     tool_names = []
 
-    # Try different ways to access tools based on FastMCP implementation
-    if hasattr(server, 'list_tools'):
+    # Try different ways to access tools based on FastMCP implementation. This is
+    # debug-only instrumentation, so skip the extra event loop run and per-tool
+    # formatting when nothing would be logged
+    debug_enabled = is_debug_enabled()
+    if debug_enabled and hasattr(server, 'list_tools'):
         try:
             # Use asyncio to run the async method in a synchronous context
             tools = asyncio.run(server.list_tools())  # type: ignore
@@ -295,52 +335,68 @@ def create_mcp_server(config: Config) -> FastMCP:
             tool_names = [tool.get('name') for tool in tools]
 
             # DEBUG - Log detailed information about each tool
-            logger.debug(f'Found {tool_count} tools via list_tools()')
+            logger.debug('Found {} tools via list_tools()', tool_count)
             for i, tool in enumerate(tools):
                 tool_name = tool.get('name', 'unknown')
                 tool_desc = tool.get('description', 'no description')
-                logger.debug(f'Tool {i}: {tool_name} - {tool_desc}')
+                logger.debug('Tool {}: {} - {}', i, tool_name, tool_desc)
 
                 # Check if the tool has a schema
                 if 'parameters' in tool:
                     params = tool.get('parameters', {})
                     if 'properties' in params:
                         properties = params.get('properties', {})
-                        logger.debug(f'  Parameters: {list(properties.keys())}')
+                        logger.debug('  Parameters: {}', list(properties))
         except Exception as e:
             logger.warning(f'Failed to list tools: {e}')
-            import traceback
-
-            logger.debug(f'Tool listing error traceback: {traceback.format_exc()}')
+            logger.opt(exception=True).debug('Tool listing error details')
 
     # DEBUG - Try to access tools directly if available
-    tools = getattr(server, '_tools', {})
+    tools = getattr(server, '_tools', {}) if debug_enabled else {}
     if tools:
-        logger.debug(f'Server has {len(tools)} tools in _tools attribute')
-        for tool_name, tool in tools.items():
-            logger.debug(f'Direct tool: {tool_name}')
-
-    # Log the prompt count
-    prompt_count = (
-        len(server._prompt_manager._prompts)
-        if hasattr(server, '_prompt_manager') and hasattr(server._prompt_manager, '_prompts')
-        else 0
-    )
+        logger.debug('Server has {} tools in _tools attribute', len(tools))
+        for tool_name in tools:
+            logger.debug('Direct tool: {}', tool_name)
+
+    # Look up the server's prompt table once; it is absent on some FastMCP versions
+    prompts = getattr(getattr(server, '_prompt_manager', None), '_prompts', None)
 
     # Log details of registered components
     if tool_count > 0:
         logger.info(f'Registered tools: {tool_names}')
 
-    if (
-        prompt_count > 0
-        and hasattr(server, '_prompt_manager')
-        and hasattr(server._prompt_manager, '_prompts')
-    ):
-        prompt_names = list(server._prompt_manager._prompts.keys())
-        logger.info(f'Registered prompts: {prompt_names}')
+    if prompts:
+        logger.info('Registered prompts: {}', list(prompts))
 
     return server
 
+async def _close_api_client() -> None:
+    """Close the API client, waiting at most _CLIENT_CLOSE_TIMEOUT for in-flight requests."""
+    client = _API_CLIENT
+    if client is None or client.is_closed:
+        return
+
+    try:
+        await asyncio.wait_for(client.aclose(), timeout=_CLIENT_CLOSE_TIMEOUT)
+    except Exception as e:
+        logger.warning('Failed to close the API client cleanly: {!r}', e)
+
+async def serve_and_close_client(serve: Callable[[], Awaitable[None]]) -> None:
+    """Serve until shutdown, then close the API client on the same event loop.
+
+    uvicorn replaces the process signal handlers while it serves and only
+    re-raises the signal after its own shutdown, so the client is closed here
+    rather than from a signal handler.
+
+    Args:
+        serve: Coroutine function that serves one or more transports until shutdown
+
+    """
+    try:
+        await serve()
+    finally:
+        await _close_api_client()
+
 def setup_signal_handlers():
     """Set up signal handlers for graceful shutdown."""
     # Store original SIGINT handler
@@ -378,16 +434,24 @@ def setup_signal_handlers():
     # For SIGINT, we'll use a special handler that logs then chains to original
     signal.signal(signal.SIGINT, signal_handler)
 
-def main():
-    """Run the MCP server with CLI argument support."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser, once per process.
+
+    Returns:
+        argparse.ArgumentParser: Parser for the server's CLI arguments
+
+    """
     parser = argparse.ArgumentParser(
         description='This project is a server that dynamically creates Model Context Protocol (MCP) tools and resources from OpenAPI specifications. It allows Large Language Models (LLMs) to interact with APIs through the Model Context Protocol.'
     )
     # Server configuration
     parser.add_argument('--port', type=int, help='Port to run the server on')
     parser.add_argument('--sse-port', type=int, help='Port for SSE transport (default: 8001)')
-    parser.add_argument('--enable-sse', action='store_true', default=None, help='Enable SSE transport for legacy clients')
-    parser.add_argument('--disable-sse', action='store_true', help='Disable SSE transport')
+    sse_group = parser.add_mutually_exclusive_group()
+    sse_group.add_argument('--enable-sse', action='store_true', default=None, help='Enable SSE transport for legacy clients')
+    sse_group.add_argument('--disable-sse', action='store_true', help='Disable SSE transport')
+    parser.add_argument('--disable-http', action='store_true', help='Disable streamable-http transport (requires SSE)')
     parser.add_argument('--path', type=str, help='HTTP endpoint path (default: /mcp)')
     parser.add_argument(
         '--log-level',
@@ -435,11 +499,15 @@ def main():
     )
     parser.add_argument('--auth-cognito-region', help='AWS region for Cognito (default: us-east-1)')
 
+    return parser
+
+def main():
+    """Run the MCP server with CLI argument support."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Set up logging with loguru at specified level
-    logger.remove()
-    logger.add(lambda msg: print(msg, end=''), level=args.log_level)
+    configure_logging(args.log_level)
     logger.info(f'Starting server with logging level: {args.log_level}')
 
     # Load configuration
@@ -447,6 +515,14 @@ def main():
     config = load_config(args)
     logger.debug(f'Configuration loaded: api_name={config.api_name}, host={config.host}, port={config.port}, path={config.path}')
 
+    # Flags and environment can together turn off both transports; refuse rather
+    # than fall back to one the user disabled
+    if not config.enable_http and not config.enable_sse:
+        parser.error(
+            'streamable-http and SSE transports are both disabled; drop --disable-http '
+            'or --disable-sse (or set ENABLE_HTTP/ENABLE_SSE to true)'
+        )
+
     # Create and run the MCP server
     logger.info('Creating MCP server')
     mcp_server = create_mcp_server(config)
@@ -456,24 +532,29 @@ def main():
 
     try:
         # Get counts of prompts, tools, resources, and resource templates
-        async def get_all_counts(server):
-            prompts = await server.get_prompts()
-            tools = await server.get_tools()
-            resources = await server.get_resources()
-
+        async def get_resource_templates(server):
             # Get resource templates if available
-            resource_templates = []
-            if hasattr(server, 'get_resource_templates'):
-                try:
-                    resource_templates = await server.get_resource_templates()
-                except AttributeError as e:
-                    # This is expected if the method exists but is not implemented
-                    logger.debug(f'get_resource_templates exists but not implemented: {e}')
-                except Exception as e:
-                    # Log other unexpected errors
-                    logger.warning(f'Error retrieving resource templates: {e}')
-
-            return len(prompts), len(tools), len(resources), len(resource_templates)
+            if not hasattr(server, 'get_resource_templates'):
+                return []
+            try:
+                return await server.get_resource_templates()
+            except AttributeError as e:
+                # This is expected if the method exists but is not implemented
+                logger.debug(f'get_resource_templates exists but not implemented: {e}')
+            except Exception as e:
+                # Log other unexpected errors
+                logger.warning(f'Error retrieving resource templates: {e}')
+            return []
+
+        async def get_all_counts(server):
+            # The getters are independent, so await them together
+            components = await asyncio.gather(
+                server.get_prompts(),
+                server.get_tools(),
+                server.get_resources(),
+                get_resource_templates(server),
+            )
+            return tuple(len(component) for component in components)
 
         prompt_count, tool_count, resource_count, resource_template_count = asyncio.run(
             get_all_counts(mcp_server)
@@ -492,24 +573,26 @@ def main():
     except Exception as e:
         logger.error(f'Error counting tools and resources: {e}')
         logger.error('Server shutting down due to error in tool/resource registration.')
-        import traceback
-
-        logger.error(f'Traceback: {traceback.format_exc()}')
+        logger.opt(exception=True).error('Tool/resource counting error details')
         sys.exit(1)
 
     # Run server with appropriate transport configuration
     if config.enable_sse:
         # Use multi-transport runner for dual transport support
         from insly.openapi_mcp_server.multi_transport import run_dual_transport
-        run_dual_transport(config)
+        run_dual_transport(config, mcp_server)
     else:
         # Run single streamable-http transport
         logger.info(f'Starting HTTP server on http://{config.host}:{config.port}{config.path}')
-        mcp_server.run(
-            transport="streamable-http",
-            host=config.host,
-            port=config.port,
-            path=config.path
+        anyio.run(
+            serve_and_close_client,
+            functools.partial(
+                mcp_server.run_async,
+                transport="streamable-http",
+                host=config.host,
+                port=config.port,
+                path=config.path
+            ),
         )
 
 if __name__ == '__main__':
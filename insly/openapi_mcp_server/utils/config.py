@@ -25,20 +25,51 @@
 
 import os
 
+# Values accepted as true for boolean settings, matching the server's ENABLE_SSE parsing
+_TRUE_VALUES = frozenset(('true', '1', 'yes'))
+
+def _env_bool(name: str, default: str) -> bool:
+    """Read a boolean setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value to use when the variable is unset
+
+    Returns:
+        bool: True if the value is one of 'true', '1' or 'yes' (case-insensitive)
+
+    """
+    return os.environ.get(name, default).lower() in _TRUE_VALUES
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value to use when the variable is unset
+
+    Returns:
+        int: The parsed value
+
+    """
+    value = os.environ.get(name)
+    return default if value is None else int(value)
+
 # Metrics configuration
-METRICS_MAX_HISTORY = int(os.environ.get('METRICS_MAX_HISTORY', '100'))
-USE_PROMETHEUS = os.environ.get('ENABLE_PROMETHEUS', 'false').lower() == 'true'
-PROMETHEUS_PORT = int(os.environ.get('PROMETHEUS_PORT', '9090'))
+METRICS_MAX_HISTORY = _env_int('METRICS_MAX_HISTORY', 100)
+USE_PROMETHEUS = _env_bool('ENABLE_PROMETHEUS', 'false')
+PROMETHEUS_PORT = _env_int('PROMETHEUS_PORT', 9090)
 
 # Operation prompts configuration
-ENABLE_OPERATION_PROMPTS = os.environ.get('ENABLE_OPERATION_PROMPTS', 'true').lower() == 'true'
+ENABLE_OPERATION_PROMPTS = _env_bool('ENABLE_OPERATION_PROMPTS', 'true')
 
 # HTTP client configuration
-HTTP_MAX_CONNECTIONS = int(os.environ.get('HTTP_MAX_CONNECTIONS', '100'))
-HTTP_MAX_KEEPALIVE = int(os.environ.get('HTTP_MAX_KEEPALIVE', '20'))
-USE_TENACITY = os.environ.get('USE_TENACITY', 'true').lower() == 'true'
+HTTP_MAX_CONNECTIONS = _env_int('HTTP_MAX_CONNECTIONS', 100)
+HTTP_MAX_KEEPALIVE = _env_int('HTTP_MAX_KEEPALIVE', 20)
+USE_TENACITY = _env_bool('USE_TENACITY', 'true')
+USE_HTTP2 = _env_bool('USE_HTTP2', 'true')
 
 # Cache configuration
-CACHE_MAXSIZE = int(os.environ.get('CACHE_MAXSIZE', '1000'))
-CACHE_TTL = int(os.environ.get('CACHE_TTL', '3600'))  # 1 hour default
-USE_CACHETOOLS = os.environ.get('USE_CACHETOOLS', 'true').lower() == 'true'
+CACHE_MAXSIZE = _env_int('CACHE_MAXSIZE', 1000)
+CACHE_TTL = _env_int('CACHE_TTL', 3600)  # 1 hour default
+USE_CACHETOOLS = _env_bool('USE_CACHETOOLS', 'true')
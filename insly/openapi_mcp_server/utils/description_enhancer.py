@@ -23,15 +23,87 @@
 
 """Enhance tool descriptions with header parameter information."""
 
-from typing import Dict, List, Any, Optional
+import functools
+import re
+from typing import Dict, List, Any, Optional, Pattern, Tuple, Union
 from insly.openapi_mcp_server import logger
 
+# HTTP methods that can hold an operation in an OpenAPI path item, in the order
+# operations are looked up within one path item
+_OPERATION_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'options', 'head')
+
+# Operations keyed by operationId and by (path, lowercase method)
+OperationIndex = Dict[Union[str, Tuple[str, str]], Dict[str, Any]]
+
+# Usage notes appended after a Bearer security requirement
+_DYNAMIC_AUTH_SECTION = (
+    "\n\n**Dynamic Authentication Support:**"
+    "\n- Include the `Authorization` parameter in your request with value: `Bearer <token>`"
+    "\n- Example: `Authorization: \"Bearer your-jwt-token-here\"`"
+    "\n- For backward compatibility, you can also use `_bearer_token: \"your-jwt-token-here\"`"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_template_pattern(spec_path: str) -> Pattern[str]:
+    """Compile a regex matching concrete paths for a templated spec path.
+
+    Args:
+        spec_path: Spec path containing {param} placeholders
+
+    Returns:
+        Compiled pattern in which each placeholder matches one path segment
+
+    """
+    # Replace {param} with a regex that matches anything except /
+    pattern = re.escape(spec_path)
+    pattern = pattern.replace(r'\{', '{').replace(r'\}', '}')
+    pattern = re.sub(r'{[^}]+}', r'[^/]+', pattern)
+    return re.compile(f"^{pattern}$")
+
+
+def build_operation_index(openapi_spec: Dict[str, Any]) -> OperationIndex:
+    """Index the operations of an OpenAPI spec in a single pass over its paths.
+
+    Args:
+        openapi_spec: The OpenAPI specification
+
+    Returns:
+        Mapping from operationId and from (path, lowercase method) to the operation.
+        When operationIds repeat, the first operation wins, taking paths in spec
+        order and methods in _OPERATION_METHODS order, matching a linear search.
+
+    """
+    index: OperationIndex = {}
+    paths = openapi_spec.get('paths')
+    if not isinstance(paths, dict):
+        return index
+
+    for path, path_item in paths.items():
+        if not isinstance(path_item, dict):
+            continue
+
+        # Fixed method order, so duplicate operationIds resolve independently of
+        # the key order in the spec
+        for method in _OPERATION_METHODS:
+            if method not in path_item:
+                continue
+            operation = path_item[method]
+            index[(path, method)] = operation
+            if isinstance(operation, dict):
+                operation_id = operation.get('operationId')
+                if operation_id:
+                    index.setdefault(operation_id, operation)
+
+    return index
+
 def enhance_description_with_headers(
     base_description: str,
     openapi_spec: Dict[str, Any],
     operation_id: str,
     path: Optional[str] = None,
-    method: Optional[str] = None
+    method: Optional[str] = None,
+    op_index: Optional[OperationIndex] = None
 ) -> str:
     """Enhance a tool description with header parameter information.
     
@@ -41,6 +113,7 @@ def enhance_description_with_headers(
         operation_id: The operation ID to find header parameters for
         path: The path of the operation (used when operation_id is None)
         method: The HTTP method of the operation (used when operation_id is None)
+        op_index: Prebuilt index from build_operation_index, reused across tools
         
     Returns:
         Enhanced description with header parameter documentation
@@ -48,11 +121,11 @@ def enhance_description_with_headers(
     # Find the operation in the OpenAPI spec
     operation = None
     if operation_id:
-        operation = find_operation_by_id(openapi_spec, operation_id)
+        operation = find_operation_by_id(openapi_spec, operation_id, op_index)
     
     # If not found by ID or no ID provided, try by path and method
     if not operation and path and method:
-        operation = find_operation_by_path_and_method(openapi_spec, path, method)
+        operation = find_operation_by_path_and_method(openapi_spec, path, method, op_index)
     
     if not operation:
         return base_description
@@ -76,72 +149,76 @@ def enhance_description_with_headers(
     
     # Add security information if present
     if security_info:
-        enhanced_parts.append("\n\n**Authentication Required:**")
-        enhanced_parts.append(f"\n{security_info}")
+        # The cached security text is added as-is rather than copied into a new string
+        enhanced_parts.extend(("\n\n**Authentication Required:**\n", security_info))
         
         # Add dynamic authentication parameter info
         if 'Bearer token authentication' in security_info:
-            enhanced_parts.append("\n\n**Dynamic Authentication Support:**")
-            enhanced_parts.append("\n- Include the `Authorization` parameter in your request with value: `Bearer <token>`")
-            enhanced_parts.append("\n- Example: `Authorization: \"Bearer your-jwt-token-here\"`")
-            enhanced_parts.append("\n- For backward compatibility, you can also use `_bearer_token: \"your-jwt-token-here\"`")
+            enhanced_parts.append(_DYNAMIC_AUTH_SECTION)
     
     # Add header parameters
     if header_params:
         enhanced_parts.append("\n\n**Header Parameters:**")
-        for param in header_params:
-            name = param.get('name', 'Unknown')
-            required = param.get('required', False)
-            description = param.get('description', 'No description provided')
-            schema = param.get('schema', {})
-            
-            required_marker = " (Required)" if required else " (Optional)"
-            
-            # Add type information if available
-            param_type = schema.get('type', '')
-            if param_type:
-                type_info = f" [{param_type}]"
-            else:
-                type_info = ""
-            
-            enhanced_parts.append(f"\n- **{name}**{required_marker}{type_info}: {description}")
+        enhanced_parts.extend(_describe_header_param(param) for param in header_params)
     
     return ''.join(enhanced_parts)
 
 
-def find_operation_by_id(openapi_spec: Dict[str, Any], operation_id: str) -> Optional[Dict[str, Any]]:
+def _describe_header_param(param: Dict[str, Any]) -> str:
+    """Format one header parameter as a line of the Header Parameters section.
+
+    Args:
+        param: The header parameter object
+
+    Returns:
+        The formatted line, including its leading newline
+
+    """
+    required_marker = " (Required)" if param.get('required', False) else " (Optional)"
+
+    # Add type information if available
+    param_type = param.get('schema', {}).get('type', '')
+    type_info = f" [{param_type}]" if param_type else ""
+
+    name = param.get('name', 'Unknown')
+    description = param.get('description', 'No description provided')
+    return f"\n- **{name}**{required_marker}{type_info}: {description}"
+
+
+def find_operation_by_id(
+    openapi_spec: Dict[str, Any],
+    operation_id: str,
+    op_index: Optional[OperationIndex] = None
+) -> Optional[Dict[str, Any]]:
     """Find an operation in the OpenAPI spec by its operationId.
     
     Args:
         openapi_spec: The OpenAPI specification
         operation_id: The operation ID to find
+        op_index: Prebuilt index from build_operation_index; built on demand if omitted
         
     Returns:
         The operation object if found, None otherwise
     """
-    if 'paths' not in openapi_spec:
-        return None
+    if op_index is None:
+        op_index = build_operation_index(openapi_spec)
     
-    for path, path_item in openapi_spec['paths'].items():
-        if not isinstance(path_item, dict):
-            continue
-            
-        for method in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
-            if method in path_item:
-                operation = path_item[method]
-                if isinstance(operation, dict) and operation.get('operationId') == operation_id:
-                    return operation
-    
-    return None
+    return op_index.get(operation_id)
 
 
-def find_operation_by_path_and_method(openapi_spec: Dict[str, Any], path: str, method: str) -> Optional[Dict[str, Any]]:
+def find_operation_by_path_and_method(
+    openapi_spec: Dict[str, Any],
+    path: str,
+    method: str,
+    op_index: Optional[OperationIndex] = None
+) -> Optional[Dict[str, Any]]:
     """Find an operation in the OpenAPI spec by its path and method.
     
     Args:
         openapi_spec: The OpenAPI specification
         path: The path of the operation (e.g., "/logout")
         method: The HTTP method (e.g., "GET")
+        op_index: Prebuilt index from build_operation_index, used for exact path matches
         
     Returns:
         The operation object if found, None otherwise
@@ -153,7 +230,11 @@ def find_operation_by_path_and_method(openapi_spec: Dict[str, Any], path: str, m
     method_lower = method.lower()
     
     # Try exact path match first
-    if path in openapi_spec['paths']:
+    if op_index is not None:
+        operation = op_index.get((path, method_lower))
+        if operation is not None:
+            return operation
+    elif path in openapi_spec['paths']:
         path_item = openapi_spec['paths'][path]
         if isinstance(path_item, dict) and method_lower in path_item:
             return path_item[method_lower]
@@ -164,18 +245,10 @@ def find_operation_by_path_and_method(openapi_spec: Dict[str, Any], path: str, m
         if not isinstance(path_item, dict):
             continue
             
-        # Simple pattern matching for path parameters
-        # Convert {param} to a regex pattern
-        pattern = spec_path
-        if '{' in pattern:
-            import re
-            # Replace {param} with a regex that matches anything except /
-            pattern = re.escape(pattern)
-            pattern = pattern.replace(r'\{', '{').replace(r'\}', '}')
-            pattern = re.sub(r'{[^}]+}', r'[^/]+', pattern)
-            pattern = f"^{pattern}$"
-            
-            if re.match(pattern, path):
+        # Simple pattern matching for path parameters, with the compiled
+        # pattern for each templated spec path cached across lookups
+        if '{' in spec_path:
+            if _path_template_pattern(spec_path).match(path):
                 if method_lower in path_item:
                     return path_item[method_lower]
     
@@ -207,38 +280,79 @@ def extract_security_requirements(openapi_spec: Dict[str, Any], operation: Dict[
     if 'components' in openapi_spec and 'securitySchemes' in openapi_spec['components']:
         security_schemes = openapi_spec['components']['securitySchemes']
     
+    # Operations usually share a handful of requirements, so the description is
+    # memoized on a hashable summary of the requirement and the schemes it uses
+    requirements = tuple(
+        (scheme_name, tuple(scopes or ()))
+        for security_req in security
+        if isinstance(security_req, dict)
+        for scheme_name, scopes in security_req.items()
+    )
+    schemes = tuple(
+        (
+            scheme_name,
+            scheme.get('type'),
+            scheme.get('scheme'),
+            scheme.get('bearerFormat'),
+            scheme.get('in', 'header'),
+            scheme.get('name', 'Unknown'),
+        )
+        for scheme_name in dict.fromkeys(name for name, _ in requirements)
+        if scheme_name in security_schemes
+        for scheme in (security_schemes[scheme_name],)
+    )
+
+    try:
+        return _describe_security(requirements, schemes)
+    except TypeError:
+        # Unhashable values in a malformed spec; describe without caching
+        return _describe_security.__wrapped__(requirements, schemes)
+
+
+@functools.lru_cache(maxsize=512)
+def _describe_security(
+    requirements: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    schemes: Tuple[Tuple[Any, ...], ...]
+) -> Optional[str]:
+    """Build the human-readable description of a set of security requirements.
+
+    Args:
+        requirements: (scheme name, scopes) pairs in requirement order
+        schemes: (name, type, scheme, bearerFormat, in, parameter name) for each known scheme
+
+    Returns:
+        A human-readable description of security requirements
+
+    """
+    scheme_fields = {fields[0]: fields[1:] for fields in schemes}
+
     # Build security description
     security_descriptions = []
     
-    for security_req in security:
-        if not isinstance(security_req, dict):
+    for scheme_name, scopes in requirements:
+        if scheme_name not in scheme_fields:
             continue
+        scheme_type, http_scheme, bearer_format, location, name = scheme_fields[scheme_name]
+
+        if scheme_type == 'http' and http_scheme == 'bearer':
+            desc = f"Bearer token authentication required. Include 'Authorization: Bearer <token>' header"
+            if bearer_format:
+                desc += f" (Format: {bearer_format})"
+            security_descriptions.append(desc)
             
-        for scheme_name, scopes in security_req.items():
-            if scheme_name in security_schemes:
-                scheme = security_schemes[scheme_name]
-                
-                if scheme.get('type') == 'http' and scheme.get('scheme') == 'bearer':
-                    desc = f"Bearer token authentication required. Include 'Authorization: Bearer <token>' header"
-                    if scheme.get('bearerFormat'):
-                        desc += f" (Format: {scheme['bearerFormat']})"
-                    security_descriptions.append(desc)
-                    
-                elif scheme.get('type') == 'apiKey':
-                    location = scheme.get('in', 'header')
-                    name = scheme.get('name', 'Unknown')
-                    desc = f"API Key authentication required. Include '{name}' in {location}"
-                    security_descriptions.append(desc)
-                    
-                elif scheme.get('type') == 'http' and scheme.get('scheme') == 'basic':
-                    desc = "Basic authentication required. Include 'Authorization: Basic <credentials>' header"
-                    security_descriptions.append(desc)
-                    
-                elif scheme.get('type') == 'oauth2':
-                    desc = "OAuth 2.0 authentication required"
-                    if scopes:
-                        desc += f" with scopes: {', '.join(scopes)}"
-                    security_descriptions.append(desc)
+        elif scheme_type == 'apiKey':
+            desc = f"API Key authentication required. Include '{name}' in {location}"
+            security_descriptions.append(desc)
+
+        elif scheme_type == 'http' and http_scheme == 'basic':
+            desc = "Basic authentication required. Include 'Authorization: Basic <credentials>' header"
+            security_descriptions.append(desc)
+
+        elif scheme_type == 'oauth2':
+            desc = "OAuth 2.0 authentication required"
+            if scopes:
+                desc += f" with scopes: {', '.join(scopes)}"
+            security_descriptions.append(desc)
     
     if security_descriptions:
         return '\n'.join(f"- {desc}" for desc in security_descriptions)
@@ -360,6 +474,32 @@ def add_auth_parameters_to_tool_schema(tool: Any, openapi_spec: Dict[str, Any],
     return modified
 
 
+def _has_enhanceable_operations(openapi_spec: Dict[str, Any], op_index: OperationIndex) -> bool:
+    """Check whether any operation has header parameters or security requirements.
+
+    Args:
+        openapi_spec: The OpenAPI specification
+        op_index: Index from build_operation_index
+
+    Returns:
+        False if no tool description or schema could be enhanced, True otherwise
+
+    """
+    if openapi_spec.get('security'):
+        return True
+
+    for operation in op_index.values():
+        if not isinstance(operation, dict):
+            continue
+        if operation.get('security'):
+            return True
+        for param in operation.get('parameters') or ():
+            if isinstance(param, dict) and param.get('in') == 'header':
+                return True
+
+    return False
+
+
 def enhance_tool_descriptions(server: Any, openapi_spec: Dict[str, Any]) -> None:
     """Enhance all tool descriptions in the server with header parameter information.
     
@@ -375,38 +515,35 @@ def enhance_tool_descriptions(server: Any, openapi_spec: Dict[str, Any]) -> None
     enhanced_count = 0
     schema_enhanced_count = 0
     
+    # Descriptions from a previous spec won't be reused, so don't keep them alive
+    _describe_security.cache_clear()
+
+    # Index the spec once so each tool's lookup is a dict access, not a scan of all paths
+    op_index = build_operation_index(openapi_spec)
+
+    if not _has_enhanceable_operations(openapi_spec, op_index):
+        logger.debug("No header parameters or security requirements to add to tool descriptions")
+        return
+
     for tool_name, tool in tools.items():
-        # Get the operation ID, path, and method from the tool
-        operation_id = None
-        path = None
-        method = None
-        
-        # Try to get route information from tool
-        route = None
-        if hasattr(tool, '_route'):
-            route = tool._route
-        elif hasattr(tool, 'route'):
-            route = tool.route
+        # Get the operation ID, path, and method from the tool's route; tools
+        # without one have no operation to enhance from
+        route = getattr(tool, '_route', None) or getattr(tool, 'route', None)
+        if not route:
+            continue
         
-        if route:
-            # Get operation_id if available
-            if hasattr(route, 'operation_id'):
-                operation_id = route.operation_id
-            
-            # Get path and method
-            if hasattr(route, 'path'):
-                path = route.path
-            if hasattr(route, 'method'):
-                method = route.method
+        operation_id = getattr(route, 'operation_id', None)
+        path = getattr(route, 'path', None)
+        method = getattr(route, 'method', None)
         
         # Find the operation in the OpenAPI spec
         operation = None
         if operation_id:
-            operation = find_operation_by_id(openapi_spec, operation_id)
+            operation = find_operation_by_id(openapi_spec, operation_id, op_index)
         
         # If not found by ID or no ID provided, try by path and method
         if not operation and path and method:
-            operation = find_operation_by_path_and_method(openapi_spec, path, method)
+            operation = find_operation_by_path_and_method(openapi_spec, path, method, op_index)
         
         # Enhance the description
         original_description = tool.description
@@ -415,7 +552,8 @@ def enhance_tool_descriptions(server: Any, openapi_spec: Dict[str, Any]) -> None
             openapi_spec,
             operation_id,
             path,
-            method
+            method,
+            op_index
         )
         
         if enhanced_description != original_description:
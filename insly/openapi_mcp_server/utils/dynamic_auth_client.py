@@ -24,7 +24,7 @@
 """Dynamic authentication client wrapper for per-request authentication support."""
 
 import httpx
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Union
 import json
 from loguru import logger
 
@@ -126,7 +126,7 @@ class DynamicAuthClient(httpx.AsyncClient):
 
 def create_dynamic_auth_client(
     base_url: str,
-    default_headers: Optional[Dict[str, str]] = None,
+    default_headers: Optional[Mapping[str, str]] = None,
     **kwargs
 ) -> DynamicAuthClient:
     """Create a DynamicAuthClient instance.
@@ -29,10 +29,12 @@ and other improvements. It can use different backends based on configuration.
 
 import asyncio
 import httpx
+import importlib.util
 from insly.openapi_mcp_server import logger
 from insly.openapi_mcp_server.utils.config import (
     HTTP_MAX_CONNECTIONS,
     HTTP_MAX_KEEPALIVE,
+    USE_HTTP2,
     USE_TENACITY,
 )
 from insly.openapi_mcp_server.utils.metrics_provider import api_call_timer
@@ -50,6 +52,15 @@ if USE_TENACITY:
     except ImportError:
         logger.warning('tenacity requested but not installed. Install with: pip install tenacity')
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = False
+if USE_HTTP2:
+    HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+    if HTTP2_AVAILABLE:
+        logger.info('HTTP/2 enabled')
+    else:
+        logger.debug('h2 not installed, using HTTP/1.1. Install with: pip install httpx[http2]')
+
 class HttpClientFactory:
     """Factory for creating HTTP clients with enhanced functionality."""
 
@@ -154,6 +165,7 @@ class HttpClientFactory:
                 max_connections=max_connections,
                 max_keepalive_connections=max_keepalive,
             ),
+            http2=HTTP2_AVAILABLE,
         )
 
         logger.info(
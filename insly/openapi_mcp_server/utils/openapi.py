@@ -61,6 +61,30 @@ try:
 except ImportError:
     yaml = None  # type: Optional[Any]
 
+# Use orjson's faster parser when it's installed; its decode error subclasses
+# json.JSONDecodeError, so the YAML fallback below handles both parsers alike
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: Optional[Any]
+
+def _loads_json(content: str) -> Any:
+    """Parse a JSON document, preferring orjson when available.
+
+    Args:
+        content: JSON text to parse
+
+    Returns:
+        Any: The parsed document
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 # Try to import prance, but don't fail if it's not installed
 try:
     from prance import ResolvingParser
@@ -182,7 +206,7 @@ def load_openapi_spec(url: str = '', path: str = '') -> Dict[str, Any]:
                     with open(spec_path, 'r') as f:
                         content = f.read()
                         try:
-                            spec = json.loads(content)
+                            spec = _loads_json(content)
                         except json.JSONDecodeError as json_err:
                             # If it's not JSON, try to parse as YAML
                             try:
@@ -202,7 +226,7 @@ def load_openapi_spec(url: str = '', path: str = '') -> Dict[str, Any]:
                 with open(spec_path, 'r') as f:
                     content = f.read()
                     try:
-                        spec = json.loads(content)
+                        spec = _loads_json(content)
                     except json.JSONDecodeError as json_err:
                         # If it's not JSON, try to parse as YAML
                         try:
@@ -27,9 +27,11 @@ This module provides validation for OpenAPI specifications using openapi-core
 when available, with a simple fallback implementation.
 """
 
+import hashlib
+import json
 import os
 from insly.openapi_mcp_server import logger
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Check if openapi-core is available
 openapi_core = None
@@ -47,6 +49,30 @@ USE_OPENAPI_CORE = OPENAPI_CORE_AVAILABLE and os.environ.get(
     'MCP_USE_OPENAPI_CORE', 'true'
 ).lower() in ('true', '1', 'yes')
 
+# Digests of specs that openapi-core has already accepted in this process
+_VALIDATED_SPEC_DIGESTS: Set[str] = set()
+
+def _spec_digest(spec: Dict[str, Any]) -> Optional[str]:
+    """Compute a content digest for a specification.
+
+    Args:
+        spec: The OpenAPI specification
+
+    Returns:
+        Optional[str]: Hex digest of the canonical JSON form, or None if the spec
+            cannot be serialized
+
+    """
+    try:
+        payload = json.dumps(spec, sort_keys=True, default=str).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def clear_validation_cache() -> None:
+    """Forget which specifications have already been validated with openapi-core."""
+    _VALIDATED_SPEC_DIGESTS.clear()
+
 def validate_openapi_spec(spec: Dict[str, Any]) -> bool:
     """Validate an OpenAPI specification.
 
@@ -85,6 +111,13 @@ def validate_openapi_spec(spec: Dict[str, Any]) -> bool:
 
     # Use openapi-core for additional validation if available
     if USE_OPENAPI_CORE and openapi_core is not None:
+        # The same spec is validated when it is loaded and again when the server is
+        # built; hashing it is far cheaper than a second openapi-core pass
+        digest = _spec_digest(spec)
+        if digest is not None and digest in _VALIDATED_SPEC_DIGESTS:
+            logger.debug('OpenAPI spec already validated with openapi-core')
+            return True
+
         try:
             # Create spec object - this will validate the spec
             if hasattr(openapi_core, 'create_spec'):
@@ -103,6 +136,8 @@ def validate_openapi_spec(spec: Dict[str, Any]) -> bool:
             else:
                 logger.warning('Unsupported openapi-core version - skipping additional validation')
             logger.debug('OpenAPI spec validated with openapi-core')
+            if digest is not None:
+                _VALIDATED_SPEC_DIGESTS.add(digest)
         except Exception as e:
             logger.error(f'Error validating OpenAPI spec with openapi-core: {e}')
             # We already did basic validation, so we'll still return True
@@ -233,3 +233,37 @@ def test_load_config_precedence():
         # Restore original environment
         os.environ.clear()
         os.environ.update(original_env)
+
+
+def test_load_config_disable_http():
+    """Test that the streamable-http transport can be disabled from args and env."""
+    config = Config()
+    assert config.enable_http is True
+
+    args = MagicMock(spec=['disable_http'])
+    args.disable_http = True
+    assert load_config(args).enable_http is False
+
+    original_env = os.environ.copy()
+    try:
+        os.environ['ENABLE_HTTP'] = 'false'
+        assert load_config().enable_http is False
+    finally:
+        os.environ.clear()
+        os.environ.update(original_env)
+
+
+def test_load_config_logs_its_caller():
+    """Test that the lazily built debug message names the function calling load_config."""
+    from awslabs.openapi_mcp_server import logger
+
+    messages = []
+    handler_id = logger.add(messages.append, level='DEBUG', format='{message}')
+    try:
+        load_config()
+    finally:
+        logger.remove(handler_id)
+
+    callers = [m.strip() for m in messages if m.startswith('Called from ')]
+    assert len(callers) == 1
+    assert callers[0].split(':')[-2] == 'test_load_config_logs_its_caller'
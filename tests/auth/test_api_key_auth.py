@@ -180,6 +180,9 @@ class TestApiKeyAuthProvider:
         except ValueError:
             pytest.fail('Hash is not a valid hex string')
 
+        # Test that the hash is deterministic
+        assert hash_method('test_api_key') == hash1
+
         # Test that different keys produce different hashes
         hash2 = hash_method('different_key')
         assert hash1 != hash2
@@ -202,6 +205,29 @@ class TestApiKeyAuthProvider:
         # Test that the provider was created successfully
         assert provider.provider_name == 'api_key'
 
+    def test_auth_data_generated_lazily(self):
+        """Test that auth data is generated on first use and only once."""
+        config = Config()
+        config.auth_api_key = 'test_api_key'
+        config.auth_api_key_name = 'X-API-Key'
+        config.auth_api_key_in = 'header'
+
+        with patch.object(
+            ApiKeyAuthProvider,
+            '_generate_auth_headers',
+            return_value={'X-API-Key': 'test_api_key'},
+        ) as mock_generate:
+            provider = ApiKeyAuthProvider(config)
+
+            # Nothing is generated at construction time
+            mock_generate.assert_not_called()
+
+            assert provider.get_auth_headers() == {'X-API-Key': 'test_api_key'}
+            assert provider.get_auth_headers() == {'X-API-Key': 'test_api_key'}
+
+            # Generated exactly once
+            mock_generate.assert_called_once()
+
     def test_handle_validation_error(self):
         """Test handling of validation error."""
         # Create a configuration
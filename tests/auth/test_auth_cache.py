@@ -13,8 +13,11 @@
 # limitations under the License.
 """Tests for authentication caching."""
 
+import gc
+import threading
 import time
 import unittest
+import weakref
 from awslabs.openapi_mcp_server.auth.auth_cache import (
     TokenCache,
     cached_auth_data,
@@ -100,6 +103,22 @@ class TestTokenCache(unittest.TestCase):
         self.assertEqual(self.cache.get('key3'), 'value3')
         self.assertEqual(self.cache.get('key4'), 'value4')
 
+    def test_max_size_evicts_least_recently_used(self):
+        """Test that reading a value protects it from eviction."""
+        self.cache.set('key1', 'value1')
+        self.cache.set('key2', 'value2')
+        self.cache.set('key3', 'value3')
+
+        # Touch the oldest entry so key2 becomes the least recently used
+        self.assertEqual(self.cache.get('key1'), 'value1')
+
+        self.cache.set('key4', 'value4')
+
+        self.assertIsNone(self.cache.get('key2'))
+        self.assertEqual(self.cache.get('key1'), 'value1')
+        self.assertEqual(self.cache.get('key3'), 'value3')
+        self.assertEqual(self.cache.get('key4'), 'value4')
+
     def test_delete(self):
         """Test deleting values from the cache."""
         # Set a value
@@ -149,6 +168,29 @@ class TestTokenCache(unittest.TestCase):
         # The other value should still be available
         self.assertEqual(self.cache.get('key2'), 'value2')
 
+    def test_concurrent_access(self):
+        """Test that concurrent set, get and cleanup calls do not corrupt the cache."""
+        cache = TokenCache(max_size=10, ttl=0.001)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(500):
+                    cache.set(f'key{offset}-{i}', i)
+                    cache.get(f'key{offset}-{i - 1}')
+                    cache.cleanup()
+            except Exception as e:  # pragma: no cover - only reached on failure
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache._cache), 10)
+
 
 class TestCachedAuthData(unittest.TestCase):
     """Test cases for the cached_auth_data decorator."""
@@ -198,6 +240,35 @@ class TestCachedAuthData(unittest.TestCase):
         # The function should be called twice
         self.assertEqual(self.test_func.call_count, 2)
 
+    def test_kwargs_order_shares_entry(self):
+        """Test that keyword argument order does not affect the cache key."""
+        self.decorated_func('arg1', a=1, b=2)
+        self.decorated_func('arg1', b=2, a=1)
+
+        # The function should only be called once
+        self.assertEqual(self.test_func.call_count, 1)
+
+    def test_method_cache_does_not_retain_instance(self):
+        """Test that caching a method result does not keep the instance alive."""
+
+        class Provider:
+            calls = 0
+
+            @cached_auth_data(ttl=60)
+            def generate(self, value):
+                Provider.calls += 1
+                return {'value': value}
+
+        provider = Provider()
+        self.assertEqual(provider.generate('a'), {'value': 'a'})
+        self.assertEqual(provider.generate('a'), {'value': 'a'})
+        self.assertEqual(Provider.calls, 1)
+
+        ref = weakref.ref(provider)
+        del provider
+        gc.collect()
+        self.assertIsNone(ref())
+
     def test_expiration(self):
         """Test that cached results expire after TTL."""
         # Call the function
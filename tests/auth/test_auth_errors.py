@@ -81,6 +81,25 @@ class TestAuthErrors(unittest.TestCase):
         error = NetworkError('Network error')
         self.assertEqual(error.error_type, AuthErrorType.NETWORK_ERROR)
 
+    def test_errors_without_details_share_empty_mapping(self):
+        """Test that detail-less errors share one read-only empty mapping."""
+        first = AuthError('First')
+        second = NetworkError('Second')
+        self.assertEqual(first.details, {})
+        self.assertIs(first.details, second.details)
+        with self.assertRaises(TypeError):
+            first.details['key'] = 'value'  # type: ignore[index]
+
+        # An explicitly passed dict is kept as-is, even when empty
+        details = {}
+        self.assertIs(AuthError('Third', details=details).details, details)
+
+    def test_error_attributes_use_slots(self):
+        """Test that error attributes are stored in slots rather than an instance dict."""
+        for error in (AuthError('Test'), NetworkError('Network error', {'host': 'x'})):
+            self.assertEqual(error.__dict__, {})
+        self.assertEqual(NetworkError.__slots__, ())
+
     def test_create_auth_error(self):
         """Test creating auth errors using the factory function."""
         # Create a MissingCredentialsError
@@ -96,6 +115,12 @@ class TestAuthErrors(unittest.TestCase):
         self.assertIsInstance(error, AuthError)
         self.assertEqual(error.error_type, AuthErrorType.UNKNOWN_ERROR)
 
+        # Every member dispatches to its class, and non-members fall back to unknown
+        for error_type in AuthErrorType:
+            self.assertEqual(create_auth_error(error_type, 'msg').error_type, error_type)
+        error = create_auth_error('not_a_member', 'Unknown error')  # type: ignore[arg-type]
+        self.assertEqual(error.error_type, AuthErrorType.UNKNOWN_ERROR)
+
     def test_format_error_message(self):
         """Test formatting error messages."""
         message = format_error_message(
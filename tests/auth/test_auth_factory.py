@@ -103,6 +103,21 @@ class TestAuthFactory:
         if 'test' in _AUTH_PROVIDERS:
             del _AUTH_PROVIDERS['test']
 
+    def test_register_leaves_provider_class_untouched(self):
+        """Test that registration does not add attributes to the provider class."""
+
+        class NamedProvider(AuthProvider):
+            provider_name = 'named'
+
+        attributes = dict(vars(NamedProvider))
+        register_auth_provider('named', NamedProvider)
+        try:
+            assert dict(vars(NamedProvider)) == attributes
+        finally:
+            from awslabs.openapi_mcp_server.auth.auth_factory import _AUTH_PROVIDERS
+
+            del _AUTH_PROVIDERS['named']
+
     def test_register_duplicate_provider(self):
         """Test registering a duplicate provider."""
         with pytest.raises(ValueError):
@@ -16,10 +16,14 @@
 import unittest
 from awslabs.openapi_mcp_server.api.config import Config
 from awslabs.openapi_mcp_server.auth.auth_factory import (
+    _AUTH_PROVIDERS,
     _PROVIDER_CACHE,
+    _PROVIDER_CACHE_MAX_SIZE,
     clear_provider_cache,
     get_auth_provider,
 )
+from awslabs.openapi_mcp_server.auth.bearer_auth import BearerAuthProvider
+from unittest.mock import patch
 
 
 class TestAuthFactoryCaching(unittest.TestCase):
@@ -107,6 +111,69 @@ class TestAuthFactoryCaching(unittest.TestCase):
         # The new provider should be different
         self.assertIsNot(provider1, provider4)
 
+    def test_cache_key_follows_auth_fields(self):
+        """Test that the cache key changes with auth fields only."""
+        provider1 = get_auth_provider(self.config)
+        key = self.config.auth_cache_key
+
+        # Non-auth fields leave the key alone
+        self.config.port = 9000
+        self.assertEqual(self.config.auth_cache_key, key)
+        self.assertIs(get_auth_provider(self.config), provider1)
+
+        # Auth fields change it
+        self.config.auth_username = 'user'
+        self.assertNotEqual(self.config.auth_cache_key, key)
+
+    def test_identical_credentials_share_auth_headers(self):
+        """Test that configs with the same credentials share one read-only header mapping."""
+        configs = []
+        for _ in range(2):
+            config = Config()
+            config.auth_type = 'bearer'
+            config.auth_token = 'shared_token'
+            configs.append(config)
+
+        with patch.dict(_AUTH_PROVIDERS, {'bearer': BearerAuthProvider}):
+            headers = [get_auth_provider(config).get_auth_headers() for config in configs]
+
+        self.assertEqual(headers[0]['Authorization'], 'Bearer shared_token')
+        self.assertIs(headers[0], headers[1])
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used provider is dropped once the cache is full."""
+        first = get_auth_provider(self.config)
+        for i in range(_PROVIDER_CACHE_MAX_SIZE):
+            config = Config()
+            config.auth_type = 'none'
+            config.auth_token = f'token-{i}'
+            get_auth_provider(config)
+
+        self.assertEqual(len(_PROVIDER_CACHE), _PROVIDER_CACHE_MAX_SIZE)
+        self.assertIsNot(get_auth_provider(self.config), first)
+
+    def test_cache_keeps_recently_used_provider(self):
+        """Test that a provider used since it was cached survives the cache filling up."""
+        first = get_auth_provider(self.config)
+        configs = []
+        for i in range(_PROVIDER_CACHE_MAX_SIZE):
+            config = Config()
+            config.auth_type = 'none'
+            config.auth_token = f'token-{i}'
+            configs.append(config)
+
+        # Fill the cache to one below its bound, touch the first entry, then overflow it
+        for config in configs[:-1]:
+            get_auth_provider(config)
+        self.assertIs(get_auth_provider(self.config), first)
+        second = get_auth_provider(configs[0])
+        get_auth_provider(configs[-1])
+
+        self.assertEqual(len(_PROVIDER_CACHE), _PROVIDER_CACHE_MAX_SIZE)
+        self.assertIs(get_auth_provider(self.config), first)
+        self.assertIs(get_auth_provider(configs[0]), second)
+        self.assertNotIn(configs[1].auth_cache_key, _PROVIDER_CACHE)
+
 
 if __name__ == '__main__':
     unittest.main()
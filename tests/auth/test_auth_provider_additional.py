@@ -1,5 +1,6 @@
 """Additional tests for auth_provider module to improve coverage."""
 
+import pytest
 from awslabs.openapi_mcp_server.auth.auth_provider import NullAuthProvider
 from unittest.mock import MagicMock
 
@@ -20,6 +21,18 @@ class TestNullAuthProvider:
         assert provider.get_auth_cookies() == {}
         assert provider.get_httpx_auth() is None
 
+        # The name is a plain class attribute rather than a property
+        assert NullAuthProvider.provider_name == 'none'
+
+        # The empty results are shared rather than allocated per call
+        assert provider.get_auth_headers() is provider.get_auth_params()
+        assert provider.get_auth_headers() is NullAuthProvider().get_auth_cookies()
+
+        # The shared result is read-only, so no caller can change it for the others
+        with pytest.raises(TypeError):
+            provider.get_auth_headers()['Authorization'] = 'Bearer token'  # type: ignore[index]
+        assert provider.get_auth_headers() == {}
+
         # Test with config
         config = MagicMock()
         provider_with_config = NullAuthProvider(config)
@@ -14,6 +14,8 @@
 """Tests for the base authentication provider."""
 
 import unittest
+from awslabs.openapi_mcp_server.auth.auth_errors import ConfigurationError
+from awslabs.openapi_mcp_server.auth.auth_provider import AuthProvider
 from awslabs.openapi_mcp_server.auth.base_auth import BaseAuthProvider
 from unittest.mock import MagicMock
 
@@ -127,6 +129,36 @@ class TestBaseAuthProvider(unittest.TestCase):
         # Check that is_configured returns False
         self.assertFalse(provider.is_configured())
 
+    def test_unimplemented_hooks_raise_not_implemented(self):
+        """Test that unimplemented interface methods raise NotImplementedError."""
+        with self.assertRaises(NotImplementedError):
+            AuthProvider().get_auth_headers()
+
+        # A provider without _validate_config fails initialization with one wrapped error
+        class IncompleteProvider(BaseAuthProvider):
+            @property
+            def provider_name(self):
+                return 'incomplete'
+
+        with self.assertRaises(ConfigurationError) as ctx:
+            IncompleteProvider(MagicMock())
+        self.assertIsInstance(ctx.exception.__cause__, NotImplementedError)
+
+    def test_validation_error_returned_is_recorded_and_raised(self):
+        """Test that an error returned by _validate_config is recorded and raised as-is."""
+        error = ConfigurationError('Bad config')
+
+        class ReturningProvider(BaseAuthProvider):
+            def _validate_config(self):
+                return False, error
+
+            provider_name = 'returning'
+
+        with self.assertRaises(ConfigurationError) as ctx:
+            ReturningProvider(MagicMock())
+        self.assertIs(ctx.exception, error)
+        self.assertIsNone(ctx.exception.__cause__)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -69,54 +69,23 @@ class TestBasicAuthProvider:
         # Check the error message
         assert 'Basic authentication requires a password' in str(excinfo.value)
 
-    def test_hash_credentials(self):
-        """Test credentials hashing."""
-        # Create a provider
-        config = Config()
-        config.auth_type = 'basic'
-        config.auth_username = 'testuser'
-        config.auth_password = 'testpass'
-        BasicAuthProvider(config)
-
-        # Get the hash method
-        hash_method = BasicAuthProvider._hash_credentials
-
-        # Test that the same credentials produce the same hash
-        # Note: With bcrypt, the hash will be different each time due to the random salt
-        # So we need to verify differently - we'll check that the hash is not empty
-        # and that it's a valid hex string
-        hash1 = hash_method('testuser', 'testpass')
-        assert hash1 is not None
-        assert len(hash1) > 0
-        # Check that it's a valid hex string
-        try:
-            int(hash1, 16)
-        except ValueError:
-            pytest.fail('Hash is not a valid hex string')
-
-        # Test that different credentials produce different hashes
-        hash2 = hash_method('otheruser', 'testpass')
-        hash3 = hash_method('testuser', 'otherpass')
-        assert hash1 != hash2
-        assert hash1 != hash3
-        assert hash2 != hash3
-
-    @patch('awslabs.openapi_mcp_server.auth.basic_auth.cached_auth_data')
-    def test_cached_auth_data(self, mock_cached_auth_data):
-        """Test that auth data is cached."""
-        # Create a configuration with valid basic auth settings
+    def test_auth_data_built_once(self):
+        """Test that auth data is built at initialization and reused."""
         config = Config()
         config.auth_username = 'test_user'
         config.auth_password = 'test_password'
 
-        # Create the provider
         provider = BasicAuthProvider(config)
 
-        # Mock the cached_auth_data decorator to return a mock function
-        mock_cached_auth_data.return_value = lambda func: func
-
-        # Test that the provider was created successfully
         assert provider.provider_name == 'basic'
+        assert provider.get_auth_headers() is provider.get_auth_headers()
+        assert provider.get_httpx_auth() is provider.get_httpx_auth()
+
+        # The shared headers are read-only
+        headers = provider.get_auth_headers()
+        assert headers['Authorization'] == 'Basic dGVzdF91c2VyOnRlc3RfcGFzc3dvcmQ='
+        with pytest.raises(TypeError):
+            headers['Authorization'] = 'tampered'
 
     def test_log_validation_error(self):
         """Test logging of validation error."""
@@ -153,8 +122,7 @@ class TestBasicAuthProvider:
         # Create the provider
         provider = BasicAuthProvider(config)
 
-        # Call _generate_auth_headers directly
-        headers = provider._generate_auth_headers('dummy_hash')
+        headers = provider.get_auth_headers()
 
         # Check the headers
         assert 'Authorization' in headers
@@ -176,8 +144,7 @@ class TestBasicAuthProvider:
         # Create the provider
         provider = BasicAuthProvider(config)
 
-        # Call _generate_httpx_auth with the required parameters
-        auth = provider._generate_httpx_auth('testuser', 'testpass')
+        auth = provider.get_httpx_auth()
 
         # Check that we get an httpx.BasicAuth object
         import httpx
@@ -185,3 +152,8 @@ class TestBasicAuthProvider:
         assert isinstance(auth, httpx.BasicAuth)
         # BasicAuth object stores credentials internally, we can't directly access them
         # but we can verify it's the correct type and was created successfully
+
+        # The HTTPX auth flow sets the same header the provider exposes
+        request = httpx.Request('GET', 'https://example.com')
+        next(auth.auth_flow(request))
+        assert request.headers['Authorization'] == provider.get_auth_headers()['Authorization']
@@ -74,9 +74,8 @@ class TestBearerAuthProvider:
         # Check that the token TTL is set correctly
         assert provider._token_ttl == 7200
 
-    @patch('awslabs.openapi_mcp_server.auth.bearer_auth.cached_auth_data')
-    def test_cached_auth_data(self, mock_cached_auth_data):
-        """Test that auth data is cached."""
+    def test_auth_headers_built_once(self):
+        """Test that auth headers are built at initialization and reused."""
         # Create a configuration with valid bearer token settings
         config = Config()
         config.auth_token = 'test_bearer_token'
@@ -84,11 +83,19 @@ class TestBearerAuthProvider:
         # Create the provider
         provider = BearerAuthProvider(config)
 
-        # Mock the cached_auth_data decorator to return a mock function
-        mock_cached_auth_data.return_value = lambda func: func
-
-        # Test that the provider was created successfully
         assert provider.provider_name == 'bearer'
+        assert provider.get_auth_headers() is provider.get_auth_headers()
+
+    def test_auth_headers_are_read_only(self):
+        """Test that the shared auth headers cannot be modified by callers."""
+        config = Config()
+        config.auth_token = 'test_bearer_token'
+
+        provider = BearerAuthProvider(config)
+
+        assert provider.get_auth_headers()['Authorization'] == 'Bearer test_bearer_token'
+        with pytest.raises(TypeError):
+            provider.get_auth_headers()['Authorization'] = 'Bearer other'  # type: ignore[index]
 
     def test_log_validation_error(self):
         """Test logging of validation error."""
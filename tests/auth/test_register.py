@@ -52,6 +52,16 @@ class TestRegisterAuthProviders:
                 # Check that register_provider_by_type was called with 'bearer'
                 mock_register_by_type.assert_called_once_with('bearer')
 
+    def test_register_auth_providers_normalizes_env(self):
+        """Test that the environment auth type is stripped and lower-cased before dispatch."""
+        with patch(
+            'awslabs.openapi_mcp_server.auth.register.register_provider_by_type'
+        ) as mock_register_by_type:
+            with patch('os.environ.get', return_value=' API_KEY\n'):
+                register_auth_providers()
+
+                mock_register_by_type.assert_called_once_with('api_key')
+
     def test_register_provider_by_type_bearer(self):
         """Test registration of bearer authentication provider."""
         # Mock the register_auth_provider function
@@ -138,6 +148,34 @@ class TestRegisterAuthProviders:
             assert 'basic' in provider_types
             assert 'bearer' in provider_types
 
+    def test_register_provider_by_type_is_idempotent(self):
+        """Test that registering an already registered provider is a no-op."""
+        from awslabs.openapi_mcp_server.auth.auth_factory import _AUTH_PROVIDERS
+        from awslabs.openapi_mcp_server.auth.bearer_auth import BearerAuthProvider
+
+        with patch.dict(_AUTH_PROVIDERS, {'bearer': BearerAuthProvider}):
+            with patch(
+                'awslabs.openapi_mcp_server.auth.register.register_auth_provider'
+            ) as mock_register:
+                register_provider_by_type('bearer')
+
+                mock_register.assert_not_called()
+
+    def test_register_all_providers_skips_registered(self):
+        """Test that already registered providers are skipped before importing them."""
+        from awslabs.openapi_mcp_server.auth.auth_factory import _AUTH_PROVIDERS
+        from awslabs.openapi_mcp_server.auth.bearer_auth import BearerAuthProvider
+
+        with patch.dict(_AUTH_PROVIDERS, {'bearer': BearerAuthProvider}):
+            with patch(
+                'awslabs.openapi_mcp_server.auth.register.register_auth_provider'
+            ) as mock_register:
+                register_all_providers()
+
+                provider_types = [call[0][0] for call in mock_register.call_args_list]
+                assert 'bearer' not in provider_types
+                assert 'basic' in provider_types
+
     def test_register_auth_provider_decorator(self):
         """Test register_auth_provider function."""
         # This test is removed as the function signature doesn't match expectations
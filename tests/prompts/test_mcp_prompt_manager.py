@@ -181,6 +181,25 @@ async def test_generate_prompts(mock_server, petstore_openapi_spec):
                 assert result['workflow_prompts_generated'] is True
 
 
+@pytest.mark.asyncio
+async def test_generate_prompts_skips_workflows_for_single_operation(mock_server):
+    """Test that workflow identification is skipped when no workflow can exist."""
+    prompt_manager = MCPPromptManager()
+    spec = {'paths': {'/pets': {'get': {'operationId': 'listPets'}}}}
+
+    with (
+        patch('awslabs.openapi_mcp_server.prompts.prompt_manager.create_operation_prompt'),
+        patch(
+            'awslabs.openapi_mcp_server.prompts.prompt_manager.identify_workflows'
+        ) as mock_identify,
+    ):
+        result = await prompt_manager.generate_prompts(mock_server, 'petstore', spec)
+
+    mock_identify.assert_not_called()
+    assert result['operation_prompts_generated'] is True
+    assert result['workflow_prompts_generated'] is False
+
+
 @pytest.mark.asyncio
 async def test_register_api_resource_handler(mock_server, mock_client):
     """Test registering an API resource handler."""
@@ -211,6 +230,20 @@ async def test_register_api_resource_handler(mock_server, mock_client):
     assert result['mimeType'] == 'application/json'
 
 
+@pytest.mark.asyncio
+async def test_api_resource_handler_path_params(mock_server, mock_client):
+    """Test that path placeholders are substituted and unknown ones are kept."""
+    prompt_manager = MCPPromptManager()
+    prompt_manager.register_api_resource_handler(mock_server, 'petstore', mock_client)
+    handler_func = mock_server.register_resource_handler.call_args[0][1]
+
+    await handler_func(
+        'api://petstore/owner/{ownerId}/pet/{petId}/{other}', {'petId': 7, 'ownerId': 'a'}
+    )
+
+    mock_client.get.assert_called_once_with('/owner/a/pet/7/{other}')
+
+
 @pytest.mark.asyncio
 async def test_api_resource_handler_error(mock_server, mock_client):
     """Test error handling in the API resource handler."""
@@ -14,7 +14,17 @@
 
 """Tests for prompt models dict method."""
 
-from awslabs.openapi_mcp_server.prompts.models import PromptArgument
+import json
+import pytest
+import sys
+from awslabs.openapi_mcp_server.prompts.models import (
+    MCPPrompt,
+    PromptArgument,
+    PromptMessage,
+    ResourceContent,
+    TextMessage,
+)
+from pydantic import ValidationError
 
 
 def test_prompt_argument_dict_with_description():
@@ -66,3 +76,48 @@ def test_prompt_argument_dict_defaults():
     }
 
     assert result == expected
+
+
+def test_prompt_argument_dict_matches_model_dump():
+    """Test PromptArgument.dict() agrees with pydantic's model_dump."""
+    arg = PromptArgument(name='test_arg', description='Test description', required=True)
+
+    assert arg.dict() == arg.model_dump(exclude_none=True)
+    assert PromptArgument(name='test_arg').dict() == PromptArgument(
+        name='test_arg'
+    ).model_dump(exclude_none=True)
+
+
+def test_prompt_models_are_frozen_and_strict():
+    """Test prompt models reject mutation and unknown fields."""
+    arg = PromptArgument(name='test_arg')
+
+    with pytest.raises(ValidationError):
+        arg.required = True  # type: ignore[misc]
+    with pytest.raises(ValidationError):
+        TextMessage(text='hello', extra_field='x')  # type: ignore[call-arg]
+
+
+def test_prompt_model_strings_are_interned():
+    """Test role and MIME type values are interned across instances."""
+    message = PromptMessage(role=''.join(['us', 'er']), content=TextMessage(text='hi'))
+    resource = ResourceContent(uri='file://x', mimeType=''.join(['text/', 'plain']))
+
+    assert message.role is sys.intern('user')
+    assert resource.mimeType is sys.intern('text/plain')
+    assert ResourceContent(uri='file://y').mimeType is sys.intern('application/json')
+
+
+def test_prompt_json_bytes():
+    """Test prompt models serialize to compact JSON bytes without None fields."""
+    prompt = MCPPrompt(
+        name='test_prompt',
+        arguments=[PromptArgument(name='test_arg', required=True)],
+        messages=[PromptMessage(role='user', content=TextMessage(text='hi'))],
+    )
+
+    data = prompt.json_bytes()
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == prompt.model_dump(exclude_none=True)
+    assert b'description' not in data
@@ -164,3 +164,14 @@ async def test_prompt_manager_generate_prompts():
             # Check the result
             assert result['operation_prompts_generated'] is True
             assert result['workflow_prompts_generated'] is False
+
+
+def test_generators_package_exports_resolve_lazily():
+    """Test that the generators package resolves its exports on first access."""
+    from awslabs.openapi_mcp_server.prompts import generators
+
+    assert set(generators.__all__) <= set(dir(generators))
+    assert generators.create_workflow_prompt is create_workflow_prompt
+    assert generators.create_operation_prompt is create_operation_prompt
+    with pytest.raises(AttributeError):
+        generators.not_a_generator
@@ -12,7 +12,7 @@
 
 import importlib
 import re
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 
 class TestInit:
@@ -65,63 +65,110 @@ class TestInit:
         assert 'test_get_caller_info_normal_case' in result
         assert 'test_init.py' in result
 
-    @patch('inspect.currentframe')
-    def test_get_caller_info_no_current_frame(self, mock_currentframe):
-        """Test that get_caller_info handles the case when currentframe returns None."""
+    @patch('sys._getframe')
+    def test_get_caller_info_shallow_stack(self, mock_getframe):
+        """Test that get_caller_info handles a call stack that is not deep enough."""
         # Import the function
         from awslabs.openapi_mcp_server import get_caller_info
 
-        # Mock currentframe to return None
-        mock_currentframe.return_value = None
+        # sys._getframe raises ValueError when the requested depth does not exist
+        mock_getframe.side_effect = ValueError('call stack is not deep enough')
 
         # Call get_caller_info
         result = get_caller_info()
 
         # Check that it returns "unknown"
         assert result == 'unknown'
+        mock_getframe.assert_called_once_with(2)
 
-    @patch('inspect.currentframe')
-    def test_get_caller_info_no_parent_frame(self, mock_currentframe):
-        """Test that get_caller_info handles the case when parent frame is None."""
+    def test_get_caller_info_format(self):
+        """Test that get_caller_info returns filename, function name and line number."""
         # Import the function
         from awslabs.openapi_mcp_server import get_caller_info
 
-        # Create a mock frame with no parent frame
-        mock_frame = MagicMock()
-        mock_frame.f_back = None
-        mock_currentframe.return_value = mock_frame
+        def wrapper_function():
+            return get_caller_info()
 
-        # Call get_caller_info
-        result = get_caller_info()
+        filename, function, lineno = wrapper_function().rsplit(':', 2)
 
-        # Check that it returns "unknown"
-        assert result == 'unknown'
+        assert filename.endswith('test_init.py')
+        assert function == 'test_get_caller_info_format'
+        assert lineno.isdigit()
 
-    @patch('inspect.currentframe')
-    @patch('inspect.getframeinfo')
-    def test_get_caller_info_no_caller_frame(self, mock_getframeinfo, mock_currentframe):
-        """Test that get_caller_info handles the case when caller frame is None."""
-        # Import the function
+    def test_get_caller_info_given_frame(self):
+        """Test that get_caller_info describes a frame captured earlier."""
+        import sys
         from awslabs.openapi_mcp_server import get_caller_info
 
-        # Create a mock frame hierarchy with no caller frame
-        mock_caller_frame = None
-
-        mock_parent_frame = MagicMock()
-        mock_parent_frame.f_back = mock_caller_frame
-
-        mock_frame = MagicMock()
-        mock_frame.f_back = mock_parent_frame
-        mock_currentframe.return_value = mock_frame
-
-        # This test should hit the early return condition
-        # without calling getframeinfo
-
-        # Call get_caller_info
-        result = get_caller_info()
-
-        # Check that it returns "unknown"
-        assert result == 'unknown'
-
-        # Verify that getframeinfo was never called
-        mock_getframeinfo.assert_not_called()
+        frame = sys._getframe()
+        captured_at = frame.f_lineno
+
+        filename, function, lineno = get_caller_info(frame).rsplit(':', 2)
+
+        assert filename.endswith('test_init.py')
+        assert function == 'test_get_caller_info_given_frame'
+        assert int(lineno) > captured_at
+
+    def test_configure_logging(self):
+        """Test that configure_logging replaces existing handlers with the stdout sink."""
+        import awslabs.openapi_mcp_server as pkg
+        import sys
+
+        with patch.object(pkg, 'logger') as mock_logger, patch.object(pkg, '_HANDLER_ID', None):
+            mock_logger.add.return_value = 7
+            pkg.configure_logging('WARNING')
+
+            mock_logger.remove.assert_called_once_with()
+            mock_logger.add.assert_called_once_with(
+                sys.stdout,
+                format=pkg.get_format(),
+                level='WARNING',
+                backtrace=False,
+                diagnose=False,
+            )
+            assert pkg._HANDLER_ID == 7
+
+    def test_configure_logging_hides_frame_locals(self, capsys):
+        """Test that logged tracebacks do not print the values of frame locals."""
+        import awslabs.openapi_mcp_server as pkg
+
+        # Built at runtime so the secret never appears in a printed source line
+        secret = 'SUPERSECRET-' + 'TOKEN'
+
+        def fail(headers):
+            raise RuntimeError('boom')
+
+        try:
+            pkg.configure_logging('ERROR')
+            try:
+                fail({'Authorization': 'Bearer ' + secret})
+            except RuntimeError:
+                pkg.logger.opt(exception=True).error('setup failed')
+            out = capsys.readouterr().out
+        finally:
+            pkg.logger.remove(pkg._HANDLER_ID)
+            pkg._HANDLER_ID = None
+
+        assert 'RuntimeError: boom' in out
+        assert secret not in out
+
+    def test_set_log_level_replaces_only_own_sink(self):
+        """Test that set_log_level swaps the stdout sink installed by configure_logging."""
+        import awslabs.openapi_mcp_server as pkg
+
+        with patch.object(pkg, 'logger') as mock_logger, patch.object(pkg, '_HANDLER_ID', 7):
+            mock_logger.add.return_value = 8
+            pkg.set_log_level('DEBUG')
+
+            mock_logger.remove.assert_called_once_with(7)
+            assert mock_logger.add.call_args.kwargs['level'] == 'DEBUG'
+            assert pkg._HANDLER_ID == 8
+
+    def test_is_debug_enabled_follows_lowest_sink_level(self):
+        """Test that is_debug_enabled reflects the lowest level accepted by any sink."""
+        import awslabs.openapi_mcp_server as pkg
+
+        with patch.object(pkg.logger._core, 'min_level', 20):
+            assert pkg.is_debug_enabled() is False
+        with patch.object(pkg.logger._core, 'min_level', 10):
+            assert pkg.is_debug_enabled() is True
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tests for the OpenAPI MCP Server main function."""
 
+import os
+import pytest
 from awslabs.openapi_mcp_server.server import main
 from unittest.mock import MagicMock, patch
 
@@ -46,3 +48,23 @@ def test_main_function(mock_asyncio_run, mock_parse_args, mock_load_config, mock
     # Assert
     mock_parse_args.assert_called_once()
     mock_asyncio_run.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'argv, env',
+    [
+        (['server', '--disable-http', '--disable-sse'], {}),
+        (['server'], {'ENABLE_HTTP': 'false', 'ENABLE_SSE': 'false'}),
+        (['server', '--disable-http'], {'ENABLE_SSE': 'false'}),
+    ],
+)
+@patch('awslabs.openapi_mcp_server.server.create_mcp_server')
+def test_main_rejects_disabling_both_transports(mock_create_mcp_server, argv, env, capsys):
+    """Test that main refuses to start when both transports are disabled."""
+    with patch('sys.argv', argv), patch.dict(os.environ, env):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+    assert exc_info.value.code == 2
+    assert 'both disabled' in capsys.readouterr().err
+    mock_create_mcp_server.assert_not_called()
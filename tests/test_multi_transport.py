@@ -0,0 +1,96 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the multi-transport runner."""
+
+import anyio
+import asyncio
+import pytest
+from awslabs.openapi_mcp_server.api.config import Config
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+
+@patch('awslabs.openapi_mcp_server.multi_transport.create_mcp_server')
+@patch('awslabs.openapi_mcp_server.multi_transport.run_sse_server')
+def test_sse_only_runs_in_process(mock_run_sse, mock_create_server):
+    """Test that SSE-only mode serves SSE directly."""
+    # Imported here: other tests patch server.create_mcp_server before multi_transport
+    # is first imported, so importing it at collection time would change their behaviour
+    from awslabs.openapi_mcp_server.multi_transport import run_dual_transport
+
+    config = Config(enable_sse=True, enable_http=False)
+
+    run_dual_transport(config)
+
+    mock_run_sse.assert_called_once_with(config, None)
+    mock_create_server.assert_not_called()
+
+
+@patch('awslabs.openapi_mcp_server.multi_transport.create_mcp_server')
+def test_dual_transport_shares_one_server(mock_create_server):
+    """Test that both transports run on one server in the same event loop."""
+    from awslabs.openapi_mcp_server.multi_transport import run_dual_transport
+
+    server = MagicMock()
+    server.run_async = AsyncMock()
+    mock_create_server.return_value = server
+    config = Config(enable_sse=True, enable_http=True, port=9000, sse_port=9001, path='/mcp')
+
+    run_dual_transport(config)
+
+    mock_create_server.assert_called_once_with(config)
+    server.run_async.assert_has_awaits(
+        [
+            call(transport='streamable-http', host=config.host, port=9000, path='/mcp'),
+            call(transport='sse', host=config.host, port=9001),
+        ],
+        any_order=True,
+    )
+
+
+
+def test_dual_transport_failure_cancels_other_transport():
+    """Test that one transport failing cancels the other and re-raises the error."""
+    from awslabs.openapi_mcp_server.multi_transport import _serve_dual_transport
+
+    cancelled = []
+
+    async def run_async(transport, **kwargs):
+        if transport == 'streamable-http':
+            raise RuntimeError('port in use')
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(transport)
+            raise
+
+    server = MagicMock()
+    server.run_async = run_async
+
+    with pytest.raises(RuntimeError, match='port in use'):
+        anyio.run(_serve_dual_transport, server, Config(enable_sse=True, enable_http=True))
+
+    assert cancelled == ['sse']
+
+@patch('awslabs.openapi_mcp_server.multi_transport.create_mcp_server')
+def test_dual_transport_reuses_given_server(mock_create_server):
+    """Test that an already created server is served instead of building another."""
+    from awslabs.openapi_mcp_server.multi_transport import run_dual_transport
+
+    server = MagicMock()
+    server.run_async = AsyncMock()
+
+    run_dual_transport(Config(enable_sse=True, enable_http=True), server)
+
+    mock_create_server.assert_not_called()
+    assert server.run_async.await_count == 2
@@ -177,3 +177,48 @@ def test_create_mcp_server_invalid_spec(
     mock_validate.assert_called_once()
     mock_create_client.assert_called_once()
     mock_fastmcp_openapi.assert_called_once()
+
+
+@patch('awslabs.openapi_mcp_server.server.FastMCP.from_openapi')
+@patch('awslabs.openapi_mcp_server.server.load_openapi_spec')
+@patch('awslabs.openapi_mcp_server.server.validate_openapi_spec', return_value=True)
+def test_create_mcp_server_client_sends_requests_without_auth(
+    mock_validate, mock_load_spec, mock_from_openapi
+):
+    """Test that the API client built with the null provider's auth data can send requests."""
+    import asyncio
+    import httpx
+    from awslabs.openapi_mcp_server import server as server_module
+    from awslabs.openapi_mcp_server.utils import dynamic_auth_client
+
+    mock_load_spec.return_value = {
+        'openapi': '3.0.0',
+        'info': {'title': 'Test API', 'version': '1.0.0'},
+        'paths': {},
+    }
+    mock_from_openapi.return_value = MagicMock()
+    create_client = dynamic_auth_client.create_dynamic_auth_client
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={'ok': True}))
+
+    def create_client_with_transport(*args, **kwargs):
+        return create_client(*args, transport=transport, **kwargs)
+
+    async def send(client):
+        try:
+            return await client.get('/pets')
+        finally:
+            await client.aclose()
+
+    config = Config(api_base_url='https://example.com/api', api_spec_url='https://example.com/spec')
+    with (
+        patch.object(server_module, '_API_CLIENT', None),
+        patch.object(
+            dynamic_auth_client,
+            'create_dynamic_auth_client',
+            side_effect=create_client_with_transport,
+        ),
+    ):
+        create_mcp_server(config)
+        response = asyncio.run(send(server_module._API_CLIENT))
+
+    assert response.status_code == 200
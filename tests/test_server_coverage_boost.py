@@ -54,3 +54,36 @@ class TestServerCoverageBoost:
 
             # Verify server was created
             assert server == mock_openapi_server
+
+    def test_ensure_auth_registered_is_memoized(self):
+        """Test that auth provider registration runs once per auth type."""
+        from awslabs.openapi_mcp_server.server import _ensure_auth_registered
+
+        _ensure_auth_registered.cache_clear()
+        try:
+            with (
+                patch(
+                    'awslabs.openapi_mcp_server.auth.register.register_provider_by_type'
+                ) as mock_register,
+                patch(
+                    'awslabs.openapi_mcp_server.auth.is_auth_type_available', return_value=True
+                ),
+            ):
+                assert _ensure_auth_registered('memo_test')
+                assert _ensure_auth_registered('memo_test')
+
+                mock_register.assert_called_once_with('memo_test')
+        finally:
+            _ensure_auth_registered.cache_clear()
+
+    def test_cli_parser_is_built_once(self):
+        """Test that the CLI parser is reused and rejects conflicting SSE flags."""
+        import pytest
+        from awslabs.openapi_mcp_server.server import _build_parser
+
+        parser = _build_parser()
+        assert _build_parser() is parser
+        assert parser.parse_args(['--disable-sse']).disable_sse is True
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(['--enable-sse', '--disable-sse'])
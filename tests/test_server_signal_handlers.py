@@ -13,9 +13,10 @@
 # limitations under the License.
 """Tests for the server module's signal handlers."""
 
+import pytest
 import signal
 from awslabs.openapi_mcp_server.server import setup_signal_handlers
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 
 @patch('awslabs.openapi_mcp_server.server.signal')
@@ -169,3 +170,49 @@ def test_signal_handler_sigint_ignore_handler(mock_exit, mock_metrics, mock_logg
 
     # Verify that sys.exit was called with 0
     mock_exit.assert_called_once_with(0)
+
+
+
+@patch('awslabs.openapi_mcp_server.server.logger')
+@patch('awslabs.openapi_mcp_server.server.metrics')
+def test_serving_closes_api_client_after_uvicorn_reraises_sigint(mock_metrics, mock_logger):
+    """Test that the API client is closed when uvicorn re-raises SIGINT after its shutdown."""
+    import anyio
+    from awslabs.openapi_mcp_server.server import serve_and_close_client
+
+    client = MagicMock(is_closed=False)
+    client.aclose = AsyncMock()
+
+    async def serve():
+        # uvicorn restores the previous handlers, then re-raises the captured signal
+        signal.raise_signal(signal.SIGINT)
+
+    original_sigint = signal.getsignal(signal.SIGINT)
+    original_sigterm = signal.getsignal(signal.SIGTERM)
+    try:
+        setup_signal_handlers()
+        with patch('awslabs.openapi_mcp_server.server._API_CLIENT', client):
+            with pytest.raises(SystemExit) as exc_info:
+                anyio.run(serve_and_close_client, serve)
+    finally:
+        signal.signal(signal.SIGINT, original_sigint)
+        signal.signal(signal.SIGTERM, original_sigterm)
+
+    assert exc_info.value.code == 0
+    client.aclose.assert_awaited_once()
+
+
+def test_serve_and_close_client_closes_after_clean_return():
+    """Test that the API client is closed when serving returns normally."""
+    import anyio
+    from awslabs.openapi_mcp_server.server import serve_and_close_client
+
+    client = MagicMock(is_closed=False)
+    client.aclose = AsyncMock()
+    serve = AsyncMock()
+
+    with patch('awslabs.openapi_mcp_server.server._API_CLIENT', client):
+        anyio.run(serve_and_close_client, serve)
+
+    serve.assert_awaited_once_with()
+    client.aclose.assert_awaited_once()
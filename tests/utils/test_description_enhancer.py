@@ -0,0 +1,231 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for tool description enhancement."""
+
+from awslabs.openapi_mcp_server.utils.description_enhancer import (
+    _describe_security,
+    _path_template_pattern,
+    build_operation_index,
+    enhance_description_with_headers,
+    enhance_tool_descriptions,
+    extract_security_requirements,
+    find_operation_by_id,
+    find_operation_by_path_and_method,
+)
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+SPEC = {
+    'openapi': '3.0.0',
+    'paths': {
+        '/users': {
+            'get': {'operationId': 'listUsers'},
+            'post': {'operationId': 'createUser'},
+            'parameters': [{'name': 'tenant', 'in': 'header'}],
+        },
+        '/users/{id}': {
+            'get': {'operationId': 'getUser'},
+            'delete': {'operationId': 'listUsers'},
+        },
+    },
+}
+
+
+class TestOperationIndex:
+    """Test operation lookups through the prebuilt index."""
+
+    def test_index_by_id_and_path_method(self):
+        """Test that operations are indexed by operationId and by (path, method)."""
+        index = build_operation_index(SPEC)
+
+        assert index['getUser'] is SPEC['paths']['/users/{id}']['get']
+        assert index[('/users', 'post')] is SPEC['paths']['/users']['post']
+        assert ('/users', 'parameters') not in index
+
+    def test_duplicate_operation_id_keeps_first(self):
+        """Test that the first operation in path order wins for a repeated operationId."""
+        assert find_operation_by_id(SPEC, 'listUsers') is SPEC['paths']['/users']['get']
+
+    def test_duplicate_operation_id_in_one_path_item_follows_method_order(self):
+        """Test that methods are searched in fixed order, not the spec's key order."""
+        spec = {
+            'paths': {
+                '/items': {
+                    'delete': {'operationId': 'itemOp'},
+                    'post': {'operationId': 'itemOp'},
+                    'get': {'operationId': 'itemOp'},
+                },
+            },
+        }
+
+        assert find_operation_by_id(spec, 'itemOp') is spec['paths']['/items']['get']
+        assert build_operation_index(spec)['itemOp'] is spec['paths']['/items']['get']
+
+    def test_lookups_match_with_and_without_index(self):
+        """Test that passing a prebuilt index gives the same results as a fresh lookup."""
+        index = build_operation_index(SPEC)
+
+        for operation_id in ('listUsers', 'createUser', 'getUser', 'missing'):
+            assert find_operation_by_id(SPEC, operation_id, index) is find_operation_by_id(
+                SPEC, operation_id
+            )
+
+        for path, method in (('/users', 'GET'), ('/users/42', 'get'), ('/other', 'get')):
+            assert find_operation_by_path_and_method(
+                SPEC, path, method, index
+            ) is find_operation_by_path_and_method(SPEC, path, method)
+
+    def test_spec_without_paths(self):
+        """Test that a spec without paths gives an empty index."""
+        assert build_operation_index({}) == {}
+        assert find_operation_by_id({}, 'listUsers') is None
+
+    def test_path_template_pattern_is_compiled_once(self):
+        """Test that templated spec paths compile to one cached, segment-bound pattern."""
+        pattern = _path_template_pattern('/users/{id}')
+
+        assert _path_template_pattern('/users/{id}') is pattern
+        assert pattern.match('/users/42')
+        assert not pattern.match('/users/42/roles')
+
+
+class TestSecurityRequirements:
+    """Test security requirement descriptions."""
+
+    SPEC = {
+        'security': [{'bearerAuth': []}],
+        'components': {
+            'securitySchemes': {
+                'bearerAuth': {'type': 'http', 'scheme': 'bearer', 'bearerFormat': 'JWT'},
+                'oauth': {'type': 'oauth2'},
+                'apiKey': {'type': 'apiKey', 'in': 'query', 'name': 'key'},
+            }
+        },
+    }
+
+    def test_descriptions(self):
+        """Test the description built for each supported scheme type."""
+        assert extract_security_requirements(self.SPEC, {}) == (
+            '- Bearer token authentication required. '
+            "Include 'Authorization: Bearer <token>' header (Format: JWT)"
+        )
+        assert extract_security_requirements(
+            self.SPEC, {'security': [{'oauth': ['read', 'write']}, {'apiKey': []}]}
+        ) == (
+            '- OAuth 2.0 authentication required with scopes: read, write\n'
+            "- API Key authentication required. Include 'key' in query"
+        )
+        assert extract_security_requirements(self.SPEC, {'security': []}) is None
+        assert extract_security_requirements(self.SPEC, {'security': [{'unknown': []}]}) is None
+
+    def test_shared_requirements_are_described_once(self):
+        """Test that operations sharing requirements reuse one cached description."""
+        _describe_security.cache_clear()
+
+        first = extract_security_requirements(self.SPEC, {'operationId': 'a'})
+        second = extract_security_requirements(self.SPEC, {'operationId': 'b'})
+
+        assert first is second
+        assert _describe_security.cache_info().hits == 1
+
+    def test_enhanced_description_layout(self):
+        """Test the full description built from security and header parameters."""
+        spec = {
+            **self.SPEC,
+            'paths': {
+                '/items': {
+                    'get': {
+                        'operationId': 'listItems',
+                        'parameters': [
+                            {
+                                'name': 'X-Tenant',
+                                'in': 'header',
+                                'required': True,
+                                'schema': {'type': 'string'},
+                                'description': 'Tenant code',
+                            },
+                            {'name': 'X-Trace', 'in': 'header'},
+                            {'name': 'limit', 'in': 'query'},
+                        ],
+                    }
+                }
+            },
+        }
+
+        assert enhance_description_with_headers('List items.', spec, 'listItems') == (
+            'List items.'
+            '\n\n**Authentication Required:**'
+            '\n- Bearer token authentication required. '
+            "Include 'Authorization: Bearer <token>' header (Format: JWT)"
+            '\n\n**Dynamic Authentication Support:**'
+            '\n- Include the `Authorization` parameter in your request with value: `Bearer <token>`'
+            '\n- Example: `Authorization: "Bearer your-jwt-token-here"`'
+            '\n- For backward compatibility, you can also use '
+            '`_bearer_token: "your-jwt-token-here"`'
+            '\n\n**Header Parameters:**'
+            '\n- **X-Tenant** (Required) [string]: Tenant code'
+            '\n- **X-Trace** (Optional): No description provided'
+        )
+
+
+class TestEnhanceToolDescriptions:
+    """Test enhancing the tools registered on a server."""
+
+    @staticmethod
+    def _server():
+        route = SimpleNamespace(operation_id='listUsers', path='/users', method='GET')
+        tool = SimpleNamespace(name='list_users', description='List users.', _route=route)
+        return SimpleNamespace(_tool_manager=SimpleNamespace(_tools={'list_users': tool})), tool
+
+    def test_skips_tools_when_nothing_to_add(self):
+        """Test that specs without header parameters or security skip the per-tool work."""
+        server, tool = self._server()
+        spec = {'paths': {'/users': {'get': {'operationId': 'listUsers'}}}}
+
+        with patch(
+            'awslabs.openapi_mcp_server.utils.description_enhancer.enhance_description_with_headers'
+        ) as mock_enhance:
+            enhance_tool_descriptions(server, spec)
+
+        mock_enhance.assert_not_called()
+        assert tool.description == 'List users.'
+
+    def test_enhances_tools_with_header_parameters(self):
+        """Test that header parameters still reach the tool description."""
+        server, tool = self._server()
+        spec = {
+            'paths': {
+                '/users': {
+                    'get': {
+                        'operationId': 'listUsers',
+                        'parameters': [{'name': 'X-Tenant', 'in': 'header'}],
+                    }
+                }
+            }
+        }
+
+        enhance_tool_descriptions(server, spec)
+
+        assert '**X-Tenant** (Optional)' in tool.description
+
+    def test_tools_without_route_are_left_alone(self):
+        """Test that tools without route information are skipped."""
+        server, tool = self._server()
+        del tool._route
+        spec = {'security': [{'bearerAuth': []}], 'paths': {}}
+
+        enhance_tool_descriptions(server, spec)
+
+        assert tool.description == 'List users.'
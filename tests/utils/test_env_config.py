@@ -0,0 +1,46 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for environment-based utility configuration."""
+
+import pytest
+from awslabs.openapi_mcp_server.utils.config import _env_bool, _env_int
+from unittest.mock import patch
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('true', True),
+        ('TRUE', True),
+        ('1', True),
+        ('yes', True),
+        ('false', False),
+        ('0', False),
+        ('', False),
+    ],
+)
+def test_env_bool(value, expected):
+    """Test which values enable a boolean setting."""
+    with patch.dict('os.environ', {'FLAG': value}):
+        assert _env_bool('FLAG', 'false') is expected
+
+
+def test_env_defaults():
+    """Test that unset variables fall back to their defaults."""
+    with patch.dict('os.environ', clear=True):
+        assert _env_bool('FLAG', 'true') is True
+        assert _env_int('COUNT', 100) == 100
+
+    with patch.dict('os.environ', {'COUNT': '7'}):
+        assert _env_int('COUNT', 100) == 7
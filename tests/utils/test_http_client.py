@@ -48,6 +48,18 @@ async def test_http_client_factory():
     await client.aclose()
 
 
+def test_http_client_factory_http2_flag():
+    """Test that HTTP/2 is requested only when the h2 package is available."""
+    with patch('awslabs.openapi_mcp_server.utils.http_client.httpx.AsyncClient') as mock_client:
+        with patch('awslabs.openapi_mcp_server.utils.http_client.HTTP2_AVAILABLE', True):
+            HttpClientFactory.create_client('https://example.com')
+        assert mock_client.call_args.kwargs['http2'] is True
+
+        with patch('awslabs.openapi_mcp_server.utils.http_client.HTTP2_AVAILABLE', False):
+            HttpClientFactory.create_client('https://example.com')
+        assert mock_client.call_args.kwargs['http2'] is False
+
+
 @pytest.mark.asyncio
 @patch('httpx.AsyncClient.request')
 async def test_make_request(mock_request):
@@ -140,3 +140,16 @@ class TestOpenAPIUtils:
         ):
             with pytest.raises(ValueError, match='Invalid OpenAPI specification'):
                 load_openapi_spec(path='/path/to/file.json')
+
+    def test_loads_json_prefers_orjson(self):
+        """Test that JSON specs are parsed with orjson when it is installed."""
+        from awslabs.openapi_mcp_server.utils import openapi
+
+        mock_orjson = MagicMock()
+        mock_orjson.loads.return_value = {'openapi': '3.0.0'}
+        with patch.object(openapi, 'orjson', mock_orjson):
+            assert openapi._loads_json('{"openapi": "3.0.0"}') == {'openapi': '3.0.0'}
+        mock_orjson.loads.assert_called_once_with('{"openapi": "3.0.0"}')
+
+        with patch.object(openapi, 'orjson', None):
+            assert openapi._loads_json('{"openapi": "3.0.0"}') == {'openapi': '3.0.0'}
@@ -14,6 +14,7 @@
 """Tests for the OpenAPI validator module."""
 
 from awslabs.openapi_mcp_server.utils.openapi_validator import (
+    clear_validation_cache,
     extract_api_structure,
     find_pagination_endpoints,
     validate_openapi_spec,
@@ -24,6 +25,10 @@ from unittest.mock import MagicMock, patch
 class TestOpenAPIValidator:
     """Test cases for OpenAPI validator functions."""
 
+    def setup_method(self):
+        """Start each test without remembered openapi-core results."""
+        clear_validation_cache()
+
     def test_validate_openapi_spec_valid(self):
         """Test validation of a valid OpenAPI spec."""
         spec = {
@@ -92,6 +97,31 @@ class TestOpenAPIValidator:
             assert validate_openapi_spec(spec) is True
             mock_create_spec.assert_called_once_with(spec)
 
+    def test_validate_openapi_spec_with_openapi_core_is_memoized(self):
+        """Test that openapi-core validates an unchanged spec only once."""
+        spec = {
+            'openapi': '3.0.0',
+            'info': {'title': 'Test API', 'version': '1.0.0'},
+            'paths': {'/test': {'get': {'responses': {'200': {'description': 'OK'}}}}},
+        }
+
+        with (
+            patch('awslabs.openapi_mcp_server.utils.openapi_validator.USE_OPENAPI_CORE', True),
+            patch(
+                'awslabs.openapi_mcp_server.utils.openapi_validator.openapi_core'
+            ) as mock_openapi_core,
+        ):
+            mock_create_spec = MagicMock()
+            mock_openapi_core.create_spec = mock_create_spec
+
+            # An equal copy hits the cache; a changed spec is validated again
+            assert validate_openapi_spec(spec) is True
+            assert validate_openapi_spec(dict(spec)) is True
+            assert mock_create_spec.call_count == 1
+
+            assert validate_openapi_spec({**spec, 'paths': {}}) is True
+            assert mock_create_spec.call_count == 2
+
     def test_validate_openapi_spec_with_openapi_core_exception(self):
         """Test validation when openapi-core raises an exception."""
         spec = {